@@ -5,7 +5,8 @@ Download MP4 (video + audio) and MP3 from YouTube URLs
 at the highest possible quality using yt-dlp.
 """
 
-from .core import download_mp4, download_mp3, download_playlist_mp4, get_info
+from .core import YtmediaSession, download_mp4, download_mp3, download_playlist_mp4, get_info, get_info_fast, get_info_many, get_info_many_async, get_size, invalidate_env_cache
+from .cache import clear_cache
 from .env import check_ffmpeg, get_missing_dependencies, has_ffmpeg, has_js_runtime
 from .errors import YtMediaError, DependencyMissing, DownloadFailed, UnsupportedFormat, MergeError
 from .models import DownloadResult, PlaylistResult
@@ -16,11 +17,20 @@ __all__ = [
     "download_mp3",
     "download_playlist_mp4",
     "get_info",
+    "get_info_fast",
+    "get_info_many",
+    "get_info_many_async",
+    "get_size",
+    "YtmediaSession",
     # env checks (pure, no side effects)
     "check_ffmpeg",
     "has_ffmpeg",
     "has_js_runtime",
     "get_missing_dependencies",
+    # env cache reset (clears the in-memory lookups and deletes env.json)
+    "invalidate_env_cache",
+    # metadata cache (needs ytmedia[cache])
+    "clear_cache",
     # exceptions
     "YtMediaError",
     "DependencyMissing",
@@ -0,0 +1,129 @@
+"""
+cache.py
+========
+Optional on-disk cache of get_info() results, backed by diskcache.
+Install with `pip install ytmedia[cache]`; without diskcache every
+function here is a no-op and metadata is always fetched fresh. Values are
+stored with orjson when it is installed, pickled otherwise.
+
+Entries expire after INFO_TTL seconds: the stream URLs inside an info
+dict are signed by YouTube and stop working after a few hours.
+"""
+
+import os
+import threading
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+
+# Seconds a cached info dict stays valid — well inside the ~6 hour
+# lifetime of YouTube's signed stream URLs.
+INFO_TTL = 3600
+
+# Shared with env.py, which saves detected binary paths here as env.json.
+CACHE_DIR = os.environ.get("YTMEDIA_CACHE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".cache", "ytmedia"
+)
+
+_cache: Any = None
+_cache_checked = False
+_cache_lock = threading.Lock()
+
+
+def _orjson_disk() -> Any:
+    """
+    A diskcache Disk that stores values as orjson bytes instead of pickles,
+    or None if orjson is not installed. Info dicts are large (hundreds of
+    KB with every format URL) and orjson encodes them faster than pickle.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    from diskcache import UNKNOWN, Disk
+
+    class OrjsonDisk(Disk):
+        def store(self, value, read, key=UNKNOWN):  # type: ignore[override]
+            if not read:
+                value = orjson.dumps(value)
+            return super().store(value, read, key=key)
+
+        def fetch(self, mode, filename, value, read):  # type: ignore[override]
+            data = super().fetch(mode, filename, value, read)
+            if read:
+                return data
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:   # written before orjson was installed
+                return None
+
+    return OrjsonDisk
+
+
+def _open() -> Any:
+    """The diskcache.Cache, opened on first use; None if diskcache is missing."""
+    global _cache, _cache_checked
+    if not _cache_checked:
+        with _cache_lock:
+            if not _cache_checked:
+                try:
+                    from diskcache import Cache
+                except ImportError:
+                    pass
+                else:
+                    disk   = _orjson_disk()
+                    _cache = Cache(CACHE_DIR, disk=disk) if disk else Cache(CACHE_DIR)
+                _cache_checked = True
+    return _cache
+
+
+def is_enabled() -> bool:
+    """Return True if diskcache is installed and caching is active."""
+    return _open() is not None
+
+
+def cache_key(url: str) -> str:
+    """
+    Key for url: the video id for YouTube watch / youtu.be / shorts URLs,
+    so 'youtu.be/x?t=30' and 'youtube.com/watch?v=x&list=...' share an
+    entry. Other URLs are used as-is.
+    """
+    parsed = urlparse(url)
+    host   = parsed.netloc.lower().removeprefix("www.").removeprefix("m.")
+    path   = parsed.path.strip("/")
+    if host == "youtu.be" and path:
+        return f"info:{path}"
+    if host in ("youtube.com", "music.youtube.com"):
+        video_id = parse_qs(parsed.query).get("v", [""])[0]
+        if video_id:
+            return f"info:{video_id}"
+        if path.startswith(("shorts/", "live/")):
+            return f"info:{path.split('/')[1]}"
+    return f"info:{url}"
+
+
+def get_cached_info(url: str) -> Optional[dict[str, Any]]:
+    """Return the cached info dict for url, or None."""
+    cache = _open()
+    if cache is None:
+        return None
+    info = cache.get(cache_key(url))
+    # raw bytes: written with orjson, which has since been uninstalled
+    return info if isinstance(info, dict) else None
+
+
+def store_info(url: str, info: dict[str, Any]) -> None:
+    """
+    Cache info (a sanitized, JSON-safe info dict) for INFO_TTL seconds.
+    Playlist infos are not cached: sanitizing drops their entries.
+    """
+    cache = _open()
+    if cache is not None and info.get("_type", "video") == "video":
+        cache.set(cache_key(url), info, expire=INFO_TTL)
+
+
+def clear_cache() -> int:
+    """Remove every cached entry. Returns the number of entries removed."""
+    cache = _open()
+    if cache is None:
+        return 0
+    return cache.clear()
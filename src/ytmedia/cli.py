@@ -5,13 +5,15 @@ Command-line interface for ytmedia.
 """
 
 import argparse
-import platform
+import importlib
+import importlib.metadata
 import shutil
 import subprocess
 import sys
 from pathlib import Path
 
-from .core import download_mp4, download_mp3, download_playlist_mp4, get_info
+from .core import download_mp4, download_mp3, download_playlist_mp4, get_info, get_info_fast, invalidate_env_cache
+from .cache import clear_cache, is_enabled as cache_enabled
 from .env import find_ffmpeg, find_node, find_deno, get_missing_dependencies, get_js_runtimes
 from .errors import YtMediaError, DependencyMissing
 
@@ -72,19 +74,18 @@ def cmd_install_deps() -> None:
     """
     print("=== ytmedia install-deps ===\n")
 
+    # Packages are probed via their metadata (no import, no pip run) and
+    # everything missing is installed by a single pip invocation at the end.
+    needed: list[str] = []
+
     # 1 — yt-dlp-ejs
-    try:
-        import yt_dlp_ejs  # noqa: F401
+    if _is_installed("yt-dlp-ejs"):
         print("[yt-dlp-ejs] already installed.")
-    except ImportError:
-        print("[yt-dlp-ejs] installing ...")
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "yt-dlp-ejs"],
-            stdout=subprocess.DEVNULL,
-        )
-        print("[yt-dlp-ejs] installed.")
+    else:
+        needed.append("yt-dlp-ejs")
 
     # 2 — ffmpeg
+    use_static = False
     ffmpeg = find_ffmpeg()
     if ffmpeg:
         print(f"[ffmpeg]     already found at {ffmpeg}")
@@ -101,26 +102,9 @@ def cmd_install_deps() -> None:
 
         if choice == "1":
             print()
-            print("[ffmpeg]     downloading bundled binary via static-ffmpeg ...")
-            try:
-                subprocess.check_call(
-                    [sys.executable, "-m", "pip", "install", "static-ffmpeg"],
-                    stdout=subprocess.DEVNULL,
-                )
-                import static_ffmpeg
-                static_ffmpeg.add_paths()
-                # clear lru_cache so find_ffmpeg() re-checks
-                from . import env
-                env.find_ffmpeg.cache_clear()
-                refreshed = find_ffmpeg()
-                if refreshed:
-                    print(f"[ffmpeg]     installed at {refreshed}")
-                    print("[ffmpeg]     note: scoped to this Python environment.")
-                else:
-                    print("[ffmpeg]     installed — restart your terminal to activate.")
-            except Exception as e:
-                print(f"[ffmpeg]     failed: {e}")
-                _print_ffmpeg_hint()
+            use_static = True
+            if not _is_installed("static-ffmpeg"):
+                needed.append("static-ffmpeg")
 
         elif choice == "2":
             print()
@@ -129,6 +113,39 @@ def cmd_install_deps() -> None:
         else:
             print("[ffmpeg]     skipped.")
 
+    if needed:
+        print(f"[pip]        installing {' '.join(needed)} ...")
+        try:
+            subprocess.check_call(
+                [sys.executable, "-m", "pip", "install", *needed],
+                stdout=subprocess.DEVNULL,
+            )
+        except subprocess.CalledProcessError as e:
+            print(f"[pip]        failed: {e}")
+            if use_static:
+                _print_ffmpeg_hint()
+            use_static = False
+        else:
+            importlib.invalidate_caches()   # make the new packages importable
+            print(f"[pip]        installed {' '.join(needed)}.")
+
+    if use_static:
+        print("[ffmpeg]     downloading bundled binary via static-ffmpeg ...")
+        try:
+            import static_ffmpeg
+            static_ffmpeg.add_paths()
+            # forget cached lookups so find_ffmpeg() re-checks
+            invalidate_env_cache()
+            refreshed = find_ffmpeg()
+            if refreshed:
+                print(f"[ffmpeg]     installed at {refreshed}")
+                print("[ffmpeg]     note: scoped to this Python environment.")
+            else:
+                print("[ffmpeg]     installed — restart your terminal to activate.")
+        except Exception as e:
+            print(f"[ffmpeg]     failed: {e}")
+            _print_ffmpeg_hint()
+
     # 3 — JS runtime (user must install manually)
     runtimes = get_js_runtimes()
     if runtimes:
@@ -143,7 +160,17 @@ def cmd_install_deps() -> None:
     print("\n=== done ===")
 
 
+def _is_installed(package: str) -> bool:
+    """True if the distribution is installed, read from its metadata."""
+    try:
+        importlib.metadata.version(package)
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return True
+
+
 def _print_ffmpeg_hint() -> None:
+    import platform
     system = platform.system()
     print("[ffmpeg] System-wide install:")
     if system == "Windows":
@@ -161,6 +188,91 @@ def _print_ffmpeg_hint() -> None:
 # main
 # ---------------------------------------------------------------------------
 
+def cmd_mp4(args: argparse.Namespace) -> None:
+    result = download_mp4(
+        args.url,
+        output_dir=args.output,
+        resolution=args.resolution,
+        audio=not args.no_audio,
+        debug=args.debug,
+        fragments=args.jobs,
+    )
+    print(f"\nSaved: {result.path}")
+    if result.resolution:
+        print(f"       {result.resolution}  video={result.video_codec}  audio={result.audio_codec}")
+
+
+def cmd_mp3(args: argparse.Namespace) -> None:
+    result = download_mp3(
+        args.url,
+        output_dir=args.output,
+        quality=args.quality,
+        debug=args.debug,
+        passthrough=args.passthrough,
+        fragments=args.jobs,
+    )
+    print(f"\nSaved: {result.path}")
+
+
+def cmd_playlist(args: argparse.Namespace) -> None:
+    result = download_playlist_mp4(
+        args.url,
+        output_dir=args.output,
+        resolution=args.resolution,
+        debug=args.debug,
+        workers=args.workers,
+        fragments=args.jobs,
+    )
+    print(f"\n{result}")
+
+
+def cmd_info(args: argparse.Namespace) -> None:
+    # --download needs the full format list; plain info doesn't
+    info = get_info(args.url) if args.download else get_info_fast(args.url)
+    lines = [
+        f"\nTitle    : {info.get('title')}",
+        f"Uploader : {info.get('uploader')}",
+        f"Duration : {info.get('duration_string') or info.get('duration')}s",
+    ]
+    views = info.get("view_count")
+    if views:
+        lines.append(f"Views    : {views:,}")
+    lines.append(f"URL      : {info.get('webpage_url')}")
+    lines.append(f"\nAvailable formats: {len(info.get('formats', []))}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    if args.download == "mp4":
+        result = download_mp4(
+            args.url,
+            output_dir=args.output,
+            resolution=args.resolution,
+            audio=not args.no_audio,
+            debug=args.debug,
+            info=info,
+            fragments=args.jobs,
+        )
+        print(f"\nSaved: {result.path}")
+    elif args.download == "mp3":
+        result = download_mp3(
+            args.url,
+            output_dir=args.output,
+            quality=args.quality,
+            debug=args.debug,
+            info=info,
+            passthrough=args.passthrough,
+            fragments=args.jobs,
+        )
+        print(f"\nSaved: {result.path}")
+
+
+def cmd_cache(args: argparse.Namespace) -> None:
+    if not cache_enabled():
+        print("Metadata cache is off — install it with: pip install ytmedia[cache]")
+        return
+    if args.action == "clear":
+        print(f"Removed {clear_cache()} cached entries.")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         prog="ytmedia",
@@ -173,78 +285,70 @@ examples:
   ytmedia mp4 https://youtu.be/xxxx                   # best quality MP4
   ytmedia mp4 https://youtu.be/xxxx -r 1080 -o ./vid  # 1080p
   ytmedia mp4 https://youtu.be/xxxx --no-audio        # video only
+  ytmedia mp4 https://youtu.be/xxxx -j 8              # 8 parallel fragment downloads
   ytmedia mp3 https://youtu.be/xxxx                   # 320kbps MP3
   ytmedia mp3 https://youtu.be/xxxx -q 192            # 192kbps MP3
+  ytmedia mp3 https://youtu.be/xxxx --passthrough     # source audio, no re-encode
   ytmedia playlist https://youtube.com/playlist?list=xxxx
+  ytmedia playlist https://youtube.com/playlist?list=xxxx -w 2   # 2 videos at a time
   ytmedia info https://youtu.be/xxxx
+  ytmedia info https://youtu.be/xxxx --download mp3  # show info, then download
   ytmedia mp4 https://youtu.be/xxxx --debug           # full yt-dlp logs
+  ytmedia cache clear                                  # drop cached metadata
+
+run `ytmedia <command> -h` for the options of each command
         """,
     )
+    subparsers = parser.add_subparsers(dest="mode", required=True, metavar="command")
 
-    parser.add_argument(
-        "mode",
-        choices=["doctor", "install-deps", "mp4", "mp3", "playlist", "info"],
-        help="Command to run",
-    )
-    parser.add_argument("url", nargs="?", help="YouTube video or playlist URL")
-    parser.add_argument("-o", "--output",     default="downloads", metavar="DIR")
-    parser.add_argument("-r", "--resolution", default="best",      metavar="HEIGHT")
-    parser.add_argument("-q", "--quality",    default="320",       metavar="KBPS")
-    parser.add_argument("--no-audio", action="store_true", default=False)
-    parser.add_argument("--debug",    action="store_true", default=False)
+    # options shared by every command that downloads
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("url", help="YouTube video or playlist URL")
+    common.add_argument("-o", "--output", default="downloads", metavar="DIR")
+    common.add_argument("-j", "--jobs",   default=None, type=int, metavar="N",
+                        help="fragments downloaded in parallel per video")
+    common.add_argument("--debug", action="store_true", default=False)
 
-    args = parser.parse_args()
+    video = argparse.ArgumentParser(add_help=False)
+    video.add_argument("-r", "--resolution", default="best", metavar="HEIGHT")
+    video.add_argument("--no-audio", action="store_true", default=False)
 
-    if args.mode not in ("doctor", "install-deps") and not args.url:
-        parser.error(f"url is required for '{args.mode}' mode.")
+    audio = argparse.ArgumentParser(add_help=False)
+    audio.add_argument("-q", "--quality", default="320", metavar="KBPS")
+    audio.add_argument("--passthrough", action="store_true", default=False,
+                       help="keep the source audio codec (m4a/opus) instead of re-encoding")
 
-    try:
-        if args.mode == "doctor":
-            cmd_doctor()
-
-        elif args.mode == "install-deps":
-            cmd_install_deps()
-
-        elif args.mode == "mp4":
-            result = download_mp4(
-                args.url,
-                output_dir=args.output,
-                resolution=args.resolution,
-                audio=not args.no_audio,
-                debug=args.debug,
-            )
-            print(f"\nSaved: {result.path}")
-            if result.resolution:
-                print(f"       {result.resolution}  video={result.video_codec}  audio={result.audio_codec}")
-
-        elif args.mode == "mp3":
-            result = download_mp3(
-                args.url,
-                output_dir=args.output,
-                quality=args.quality,
-                debug=args.debug,
-            )
-            print(f"\nSaved: {result.path}")
-
-        elif args.mode == "playlist":
-            result = download_playlist_mp4(
-                args.url,
-                output_dir=args.output,
-                resolution=args.resolution,
-                debug=args.debug,
-            )
-            print(f"\n{result}")
-
-        elif args.mode == "info":
-            info = get_info(args.url)
-            print(f"\nTitle    : {info.get('title')}")
-            print(f"Uploader : {info.get('uploader')}")
-            print(f"Duration : {info.get('duration_string', info.get('duration'))}s")
-            if info.get("view_count"):
-                print(f"Views    : {info.get('view_count'):,}")
-            print(f"URL      : {info.get('webpage_url')}")
-            print(f"\nAvailable formats: {len(info.get('formats', []))}")
+    sub = subparsers.add_parser("doctor", help="check dependencies")
+    sub.set_defaults(func=lambda args: cmd_doctor())
+
+    sub = subparsers.add_parser("install-deps", help="install missing dependencies")
+    sub.set_defaults(func=lambda args: cmd_install_deps())
+
+    sub = subparsers.add_parser("mp4", parents=[common, video], help="download a video as MP4")
+    sub.set_defaults(func=cmd_mp4)
+
+    sub = subparsers.add_parser("mp3", parents=[common, audio], help="download audio as MP3")
+    sub.set_defaults(func=cmd_mp3)
+
+    sub = subparsers.add_parser("playlist", parents=[common], help="download a playlist as MP4")
+    sub.add_argument("-r", "--resolution", default="best", metavar="HEIGHT")
+    sub.add_argument("-w", "--workers",    default=4, type=int, metavar="N",
+                     help="videos downloaded in parallel (max 5, at most one per CPU)")
+    sub.set_defaults(func=cmd_playlist)
 
+    sub = subparsers.add_parser("info", parents=[common, video, audio], help="print video metadata")
+    sub.add_argument("--download", choices=["mp4", "mp3"], default=None,
+                     help="download after printing, reusing the fetched metadata")
+    sub.set_defaults(func=cmd_info)
+
+    sub = subparsers.add_parser("cache", help="manage the metadata cache")
+    sub.add_argument("action", choices=["clear"])
+    sub.set_defaults(func=cmd_cache)
+
+    args = parser.parse_args()
+
+    try:
+        args.func(args)
     except DependencyMissing as e:
         print(f"\nMissing dependency: {e.dependency}")
         print(f"{e}")
@@ -259,4 +363,4 @@ examples:
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
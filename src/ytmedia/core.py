@@ -11,88 +11,345 @@ Rules:
   - Returns structured objects (DownloadResult / PlaylistResult)
   - Catches yt-dlp exceptions and re-raises as ytmedia exceptions
   - Safe to use inside FastAPI, GUIs, async apps, automation
+
+yt_dlp is imported inside the functions that use it: importing it loads
+every extractor, which short CLI runs (--help, doctor) don't need.
 """
 
-import itertools
+from __future__ import annotations
+
+import contextlib
+import multiprocessing
 import os
+import re
+import subprocess
+import sys
 import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from pathlib import Path
-from typing import Any, Optional
-
-import yt_dlp
-import yt_dlp.utils
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
-from .env import get_js_runtimes, find_ffmpeg, has_ffmpeg
-from .errors import DependencyMissing, DownloadFailed, MergeError
+from .cache import get_cached_info, is_enabled as _cache_enabled, store_info
+from .env import clear_env_cache, find_ffmpeg, get_ytdlp_js_runtimes
+from .errors import DependencyMissing, DownloadFailed, MergeError, YtMediaError
 from .models import DownloadResult, PlaylistResult
 
+if TYPE_CHECKING:
+    import yt_dlp
+
+__all__ = [
+    "YtmediaSession",
+    "download_mp4",
+    "download_mp3",
+    "download_playlist_mp4",
+    "get_info",
+    "get_info_fast",
+    "get_info_many",
+    "get_info_many_async",
+    "get_size",
+    "invalidate_env_cache",
+]
+
+
+# More parallel playlist workers than this gets rate-limited by YouTube and
+# oversubscribes the CPU with concurrent ffmpeg merges.
+_MAX_PLAYLIST_WORKERS = 5
+
+# Playlist merges run one at a time next to the downloads, so each one
+# gets the whole CPU.
+_MERGE_SLOTS = 1
+
+# DASH/HLS fragments fetched in parallel per download, and the size of each
+# ranged HTTP request for plain (non-fragmented) formats. YouTube's CDN
+# throttles long GETs without a Range header; chunking makes every media
+# request ranged. A global 'Range' in http_headers is deliberately not
+# used — it would also go out with page and API requests.
+_DEFAULT_FRAGMENTS       = 4
+_DEFAULT_HTTP_CHUNK_SIZE = 10 * 1024 * 1024
+
+# Initial read size for the socket -> file copy (yt-dlp's default is 1 KiB
+# and only grows as the transfer speeds up). Large writes keep per-write
+# latency on network drives, USB disks and WSL2 mounts from dominating.
+_DEFAULT_BUFFERSIZE = 1024 * 1024
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _ydl_opts(output_dir: str, debug: bool = False) -> dict[str, Any]:
+# Resolved on first use by _env(), cleared by invalidate_env_cache().
+_ENV_CACHE: dict[str, Any] = {}
+
+
+def _env() -> dict[str, Any]:
+    """
+    Return the ffmpeg path and the yt-dlp 'js_runtimes' option, looked up
+    once per process so looping callers don't re-probe PATH on every call.
+    """
+    if not _ENV_CACHE:
+        _ENV_CACHE["ffmpeg"] = find_ffmpeg()
+        _ENV_CACHE["js_runtimes"] = get_ytdlp_js_runtimes()
+    return _ENV_CACHE
+
+
+# Static yt-dlp options, built once. _base_opts copies one of them and
+# adds the per-call fields on top. socket_timeout is raised from yt-dlp's
+# 20s so a slow CDN edge stalls a read instead of failing the download.
+_BASE_OPTS_TEMPLATE: dict[str, Any] = {
+    "quiet":          True,
+    "no_warnings":    True,
+    "verbose":        False,
+    "noprogress":     True,    # _progress_hook draws its own line
+    "socket_timeout": 30,
+}
+_DEBUG_OPTS_TEMPLATE: dict[str, Any] = {
+    "quiet":          False,
+    "no_warnings":    False,
+    "verbose":        True,
+    "noprogress":     False,
+    "socket_timeout": 30,
+}
+
+# Output directories already created in this process.
+_CREATED_DIRS: set[str] = set()
+
+
+def _base_opts(debug: bool = False) -> dict[str, Any]:
     """Base yt-dlp options — quiet by default, verbose in debug mode."""
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    opts = dict(_DEBUG_OPTS_TEMPLATE if debug else _BASE_OPTS_TEMPLATE)
+    runtimes = _env()["js_runtimes"]
+    if runtimes:
+        opts["js_runtimes"] = dict(runtimes)
+    return opts
+
+
+def _ensure_dir(output_dir: str) -> None:
+    """Create output_dir unless this process already did."""
+    if output_dir not in _CREATED_DIRS:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(output_dir)
+
+
+def _ydl_opts(output_dir: str, debug: bool = False, ffmpeg_path: Optional[str] = None) -> dict[str, Any]:
+    """
+    Base yt-dlp options plus an output template inside output_dir.
+    ffmpeg_path, when given, is handed to yt-dlp as ffmpeg_location so its
+    postprocessors don't search PATH for ffmpeg again.
+    """
+    _ensure_dir(output_dir)
+    opts = _base_opts(debug)
+    opts["outtmpl"] = os.path.join(output_dir, "%(title)s.%(ext)s")
+    if ffmpeg_path:
+        opts["ffmpeg_location"] = ffmpeg_path
+    return opts
+
+
+def _resolve_fragments(fragments: Optional[int]) -> int:
+    """
+    Pick the parallel fragment count: explicit argument first, then the
+    YTMEDIA_FRAG_CONCURRENCY environment variable, then the default.
+    """
+    if fragments and fragments > 0:
+        return fragments
+    from_env = os.environ.get("YTMEDIA_FRAG_CONCURRENCY", "").strip()
+    if from_env.isdigit() and int(from_env) > 0:
+        return int(from_env)
+    return _DEFAULT_FRAGMENTS
+
+
+def _transfer_opts(fragments: Optional[int], http_chunk_size: Optional[int]) -> dict[str, Any]:
+    """
+    yt-dlp options for parallel fragment downloads and ranged HTTP chunks.
+    http_chunk_size=None (or 0) downloads plain formats in a single GET.
+    """
     opts: dict[str, Any] = {
-        "outtmpl":     os.path.join(output_dir, "%(title)s.%(ext)s"),
-        "quiet":       not debug,
-        "no_warnings": not debug,
-        "verbose":     debug,
+        "concurrent_fragment_downloads": _resolve_fragments(fragments),
+        "buffersize":                    _DEFAULT_BUFFERSIZE,
     }
-    runtimes = get_js_runtimes()
-    if runtimes:
-        opts["js_runtimes"] = {
-            name: {"executable": path} for name, path in runtimes.items()
-        }
+    if http_chunk_size:
+        opts["http_chunk_size"] = http_chunk_size
     return opts
 
 
-def _spinner_hooks() -> dict[str, Any]:
+def _ffmpeg_threads_per_invocation(n_workers: int) -> int:
     """
-    Postprocessor hooks that spin a braille animation during ffmpeg merge.
-    Only used in non-debug mode. Returns yt-dlp hook dicts.
+    Threads each ffmpeg process may use so that n_workers concurrent merges
+    together roughly match the CPU count instead of each taking all cores.
     """
-    chars = itertools.cycle(["\u280b","\u2819","\u2839","\u2838",
-                             "\u283c","\u2834","\u2826","\u2827",
-                             "\u2807","\u280f"])
-    stop = threading.Event()
+    return max(1, (os.cpu_count() or n_workers) // n_workers)
 
-    def _spin() -> None:
-        while not stop.is_set():
-            print(f"\r[Merger] {next(chars)} merging ...", end="", flush=True)
-            stop.wait(0.1)
-        print("\r[Merger] done.              ")
 
-    def hook(d: dict[str, Any]) -> None:
-        name   = d.get("postprocessor", "")
-        status = d.get("status", "")
-        if "Merger" not in name:
-            return
-        if status == "started":
-            stop.clear()
-            threading.Thread(target=_spin, daemon=True).start()
-        elif status == "finished":
-            stop.set()
+def _resolve_ffmpeg_threads(ffmpeg_threads: Optional[int], n_workers: int = 1) -> int:
+    """
+    Pick the ffmpeg thread count: explicit argument first, then the
+    YTMEDIA_FFMPEG_THREADS environment variable, then an even CPU split.
+    """
+    if ffmpeg_threads and ffmpeg_threads > 0:
+        return ffmpeg_threads
+    from_env = os.environ.get("YTMEDIA_FFMPEG_THREADS", "").strip()
+    if from_env.isdigit() and int(from_env) > 0:
+        return int(from_env)
+    return _ffmpeg_threads_per_invocation(n_workers)
+
+
+# Fixed ffmpeg merge flags; only -threads and the audio codec vary per call.
+# Inputs: ffmpeg >= 6.0 muxes seekable inputs 10x+ slower (a ~5hr stream
+# went from 1m48s to 10m29s); -seekable 0 restores the old speed and a
+# larger -thread_queue_size keeps the demuxer from stalling the muxer.
+# Output: copy the video; -flush_packets 0 lets ffmpeg batch its writes
+# instead of flushing the output after every packet.
+_MERGER_INPUT_FLAGS  = ("-seekable", "0", "-thread_queue_size", "1024")
+_MERGER_OUTPUT_FLAGS = ("-c:v", "copy", "-flush_packets", "0")
+
+
+def _merger_input_args(threads: int) -> list[str]:
+    """ffmpeg arguments placed before each merge input."""
+    return ["-threads", str(threads), *_MERGER_INPUT_FLAGS]
+
+
+def _merger_output_args(threads: int, copy_audio: bool = False) -> list[str]:
+    """
+    ffmpeg arguments for the merged output — copy video, AAC audio.
+    With copy_audio the audio is stream-copied too (source already AAC).
+    """
+    return [*_MERGER_OUTPUT_FLAGS, "-c:a", "copy" if copy_audio else "aac", "-threads", str(threads)]
+
+
+def _merger_args(threads: int, copy_audio: bool = False) -> dict[str, list[str]]:
+    """
+    postprocessor_args for yt-dlp's Merger. ffmpeg takes -threads once per
+    input ('merger+ffmpeg_i') and once per output ('merger').
+    """
+    return {
+        "merger+ffmpeg_i": _merger_input_args(threads),
+        "merger":          _merger_output_args(threads, copy_audio),
+    }
+
+
+def _is_aac(acodec: Optional[str]) -> bool:
+    """True for AAC audio ('mp4a.40.2', 'aac'), which MP4 takes as-is."""
+    return bool(acodec) and (acodec.startswith("mp4a") or acodec == "aac")  # type: ignore[union-attr]
+
+
+def _selected_acodec(info: dict[str, Any]) -> Optional[str]:
+    """Audio codec of the format yt-dlp picked for merging, if any."""
+    for fmt in info.get("requested_formats") or ():
+        if fmt.get("acodec", "none") != "none":
+            return fmt["acodec"]
+    return None
+
+
+# Serializes progress output. Playlist workers replace it with a lock
+# shared across processes (see _init_playlist_worker).
+_OUTPUT_LOCK: Any = threading.Lock()
+
+# Spinner glyphs, advanced by wall-clock time (10 frames a second) so
+# no counter or cycle state is kept between redraws.
+_SPIN_FRAMES = ("\u280b", "\u2819", "\u2839", "\u2838", "\u283c",
+                "\u2834", "\u2826", "\u2827", "\u2807", "\u280f")
+
+# Minimum seconds between two progress redraws of the same stream, and
+# when each stream (keyed by filename) was last drawn.
+_PROGRESS_INTERVAL = 0.1
+_LAST_FLUSH: dict[str, float] = {}
+
+# \x1b[2K clears the previous line instead of padding over it
+_PROGRESS_LINE = "\x1b[2K\r{} {:10} {:>6} of {:>10} at {:>12}  ETA {}".format
+
+# '[video]' / '[audio]' per filename, worked out on the first tick. Both
+# per-stream dicts drop the entry once the stream finishes.
+_LABEL_CACHE: dict[str, str] = {}
+
+
+def _merge_hook(d: dict[str, Any]) -> None:
+    """
+    Postprocessor hook that reports the ffmpeg merge. yt-dlp calls it with
+    'started' and 'finished', so one line each is written — no thread.
+    Only used in non-debug mode.
+    """
+    if "Merger" not in d.get("postprocessor", ""):
+        return
+    status = d.get("status", "")
+    if status == "started":
+        text = "\x1b[2K\r[Merger] merging ..."
+    elif status == "finished":
+        text = "\x1b[2K\r[Merger] done.\n"
+    else:
+        return
+    with _OUTPUT_LOCK:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
 
-    return {"postprocessor_hooks": [hook]}
+def _fmt_bytes(n: Optional[float]) -> str:
+    """Byte count as e.g. '12.34MiB', or '?' when unknown."""
+    if not n:
+        return "?"
+    for unit in ("B", "KiB", "MiB", "GiB", "TiB"):
+        if n < 1024 or unit == "TiB":
+            break
+        n /= 1024
+    return f"{n:.2f}{unit}"
 
 
 def _progress_hook(d: dict[str, Any]) -> None:
-    """Clean single-line progress display for non-debug mode."""
-    if d.get("status") != "downloading":
+    """
+    Clean single-line progress display for non-debug mode.
+    yt-dlp calls this many times a second (from several threads with
+    concurrent fragments); each stream's line is redrawn at most every
+    _PROGRESS_INTERVAL seconds, plus once when it finishes.
+    """
+    status = d.get("status")
+    if status not in ("downloading", "finished"):
         return
     filename = d.get("filename", "")
-    ext      = os.path.splitext(filename)[-1].lstrip(".")
-    label    = "[audio]" if ext in ("webm", "m4a", "opus") else "[video]"
-    pct      = d.get("_percent_str", "?%").strip()
-    speed    = d.get("_speed_str",   "?").strip()
-    size     = d.get("_total_bytes_str") or d.get("_total_bytes_estimate_str") or "?"
-    eta      = d.get("_eta_str",     "?").strip()
-    print(f"\r{label:10} {pct:>6} of {size:>10} at {speed:>12}  ETA {eta}   ",
-          end="", flush=True)
-    if d.get("status") == "finished":
-        print()
+    now      = time.monotonic()
+    if status == "downloading":
+        if now - _LAST_FLUSH.get(filename, 0.0) < _PROGRESS_INTERVAL:
+            return
+        _LAST_FLUSH[filename] = now
+        label = _LABEL_CACHE.get(filename)
+    else:
+        _LAST_FLUSH.pop(filename, None)
+        label = _LABEL_CACHE.pop(filename, None)
+    if label is None:
+        ext   = filename.rpartition(".")[2]
+        label = "[audio]" if ext in ("webm", "m4a", "opus") else "[video]"
+        if status == "downloading":
+            _LABEL_CACHE[filename] = label
+
+    # formatted from the raw numbers; yt-dlp's _*_str fields need a strip()
+    # and aren't filled in every case
+    get   = d.get
+    total = get("total_bytes") or get("total_bytes_estimate")
+    speed = get("speed")
+    eta   = get("eta")
+    if status == "finished":
+        pct = "100%"
+    elif total:
+        pct = f"{get('downloaded_bytes', 0) * 100 / total:.1f}%"
+    else:
+        pct = "?%"
+    line = _PROGRESS_LINE(
+        _SPIN_FRAMES[int(now * 10) % len(_SPIN_FRAMES)],
+        label,
+        pct,
+        _fmt_bytes(total),
+        f"{_fmt_bytes(speed)}/s" if speed else "?",
+        f"{int(eta) // 60:02d}:{int(eta) % 60:02d}" if eta is not None else "?",
+    )
+    if status == "finished":
+        line += "\n"
+    with _OUTPUT_LOCK:
+        sys.stdout.write(line)
+        sys.stdout.flush()
 
 
 def _resolution_str(info: dict[str, Any]) -> Optional[str]:
@@ -111,16 +368,25 @@ def _resolution_str(info: dict[str, Any]) -> Optional[str]:
 
 
 def _build_result(info: dict[str, Any], output_dir: str, url: str) -> DownloadResult:
-    """Build a DownloadResult from a yt-dlp info dict."""
-    filename = Path(output_dir) / f"{info.get('title', 'download')}.mp4"
-    # yt-dlp puts the final merged file at this path
-    base  = Path(output_dir) / Path(info.get("_filename", "")).stem
-    final = base.with_suffix(".mp4")
-    if final.exists():
-        filename = final
+    """
+    Build a DownloadResult from a yt-dlp info dict.
+    The path is the one yt-dlp recorded for the file it wrote (after
+    merging); only infos without one (playlists) fall back to a guess
+    with a single exists() check. A Path is only built for the returned
+    value.
+    """
+    filename = (info.get("requested_downloads") or [{}])[-1].get("filepath")
+    if not filename:
+        filename = os.path.join(output_dir, f"{info.get('title', 'download')}.mp4")
+        # yt-dlp puts the final merged file next to _filename, with .mp4
+        base, _, _ = os.path.basename(info.get("_filename", "")).rpartition(".")
+        if base:
+            final = os.path.join(output_dir, base + ".mp4")
+            if os.path.exists(final):
+                filename = final
 
     return DownloadResult(
-        path        = filename.resolve(),
+        path        = Path(os.path.abspath(filename)),
         title       = info.get("title", ""),
         url         = url,
         resolution  = _resolution_str(info),
@@ -130,10 +396,364 @@ def _build_result(info: dict[str, Any], output_dir: str, url: str) -> DownloadRe
     )
 
 
+def _extract(ydl: yt_dlp.YoutubeDL, url: str, info: Optional[dict[str, Any]] = None,
+             download: bool = True) -> dict[str, Any]:
+    """
+    Download url with ydl. When info (a get_info() result) is given, it is
+    processed directly instead of extracting the URL again, which saves a
+    round of page fetches and JS challenge solving. Private keys from the
+    earlier run (requested_formats, filepath, ...) are dropped first, like
+    yt-dlp's --load-info-json does, so format selection starts fresh.
+    With download=False only the formats are selected. Playlist infos
+    are not reused — dropping the private keys also drops their entries —
+    so the URL is extracted again.
+    """
+    if info is None or info.get("_type", "video") != "video":
+        return ydl.extract_info(url, download=download)  # type: ignore[return-value]
+    info = ydl.sanitize_info(info, remove_private_keys=True)
+    return ydl.process_ie_result(info, download=download)  # type: ignore[return-value]
+
+
+def _extract_unprocessed(ydl: yt_dlp.YoutubeDL, url: str) -> dict[str, Any]:
+    """
+    The extractor's result for url, before format selection (process=False),
+    following plain 'url' redirects such as watch?v=...&list=... under
+    noplaylist. A playlist comes back with its entries not yet extracted.
+    """
+    info = ydl.extract_info(url, download=False, process=False)
+    while info.get("_type") == "url":
+        info = ydl.extract_info(info["url"], download=False,
+                                ie_key=info.get("ie_key"), process=False)
+    return info  # type: ignore[return-value]
+
+
+def _iter_playlist_entries(playlist_url: str, debug: bool = False) -> Iterator[Optional[dict[str, Any]]]:
+    """
+    Yield the flat entries of a playlist ('url', 'id', 'title') without
+    extracting each video.
+
+    With extract_flat only the playlist pages are fetched — no format
+    resolution or JS challenge solving per entry. process=False keeps
+    the extractor's lazy entries generator, so URLs are yielded while
+    yt-dlp is still paging through the playlist: downloads can start
+    before the listing is complete and memory stays flat for very large
+    playlists. Unavailable entries (no URL) are yielded as None, and a
+    URL that resolves to a single video yields that video as the only
+    entry.
+    """
+    import yt_dlp
+
+    opts = _base_opts(debug)
+    opts["extract_flat"] = "in_playlist"
+
+    try:
+        with yt_dlp.YoutubeDL(opts) as ydl:  # type: ignore[arg-type]
+            info = ydl.extract_info(playlist_url, download=False, process=False)
+            # e.g. watch?v=...&list=... resolves to the playlist page first
+            while info.get("_type") in ("url", "url_transparent"):
+                info = ydl.extract_info(info["url"], download=False,
+                                        ie_key=info.get("ie_key"), process=False)
+            if info.get("_type", "video") == "video":
+                # a single video URL: download it as a one-entry playlist
+                yield {"url":   info.get("webpage_url") or playlist_url,
+                       "id":    info.get("id"),
+                       "title": info.get("title")}
+                return
+            for entry in info.get("entries") or []:
+                yield entry if entry and entry.get("url") else None
+    except yt_dlp.utils.YoutubeDLError as e:   # ExtractorError while paging, too
+        raise DownloadFailed(playlist_url, str(e)) from e
+
+
+# Playlist entries download concurrently, so file names carry the video id:
+# two entries with the same title (or the same video listed twice) must not
+# share '.part' files or a merged output. 'Title [id].f137.mp4' is merged
+# into 'Title [id].mp4'.
+_PLAYLIST_OUTTMPL = "%(title)s [%(id)s].f%(format_id)s.%(ext)s"
+_PLAYLIST_OUTPUT  = re.compile(r" \[([^\]]+)\]\.mp4$")
+
+
+def _existing_outputs(output_dir: str) -> dict[str, str]:
+    """
+    Merged playlist files already in output_dir, keyed by video id, so a
+    re-run skips the videos it finished last time.
+    """
+    found: dict[str, str] = {}
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            match = _PLAYLIST_OUTPUT.search(entry.name)
+            if match and entry.is_file():
+                found[match.group(1)] = entry.path
+    return found
+
+
+def _existing_result(path: str, entry: dict[str, Any]) -> DownloadResult:
+    """DownloadResult for a playlist entry whose merged file already exists."""
+    return DownloadResult(
+        path     = Path(os.path.abspath(path)),
+        title    = entry.get("title") or _PLAYLIST_OUTPUT.sub("", os.path.basename(path)),
+        url      = entry["url"],
+        filesize = os.path.getsize(path),
+    )
+
+
+def _fetch_opts(output_dir: str, resolution: str, debug: bool = False,
+                ffmpeg_path: Optional[str] = None,
+                transfer: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    """
+    yt-dlp options for playlist workers: download the video and audio
+    streams of an entry as separate files, without merging.
+
+    The ',' format selector makes yt-dlp download both formats one after
+    the other instead of handing them to its Merger postprocessor.
+    """
+    # A capped combined stream beats an uncapped video-only one; the
+    # uncapped fallbacks only apply when nothing fits the cap.
+    video = ("bestvideo/best" if resolution == "best"
+             else f"bestvideo[height<={resolution}]/best[height<={resolution}]/bestvideo/best")
+
+    opts = _ydl_opts(output_dir, debug=debug, ffmpeg_path=ffmpeg_path)
+    opts.update({
+        "format":     f"{video},bestaudio[ext=m4a]/bestaudio",
+        "outtmpl":    os.path.join(output_dir, _PLAYLIST_OUTTMPL),
+        "noplaylist": True,
+    })
+    opts.update(transfer or {})
+
+    if not debug:
+        opts["progress_hooks"] = [_progress_hook]
+    return opts
+
+
+# One YoutubeDL per playlist worker process, built by _init_playlist_worker
+# and reused for every entry that worker handles.
+_WORKER_YDL: Optional[yt_dlp.YoutubeDL] = None
+
+
+def _init_playlist_worker(output_dir: str, resolution: str, debug: bool,
+                          env: dict[str, Any], transfer: dict[str, Any],
+                          output_lock: Any) -> None:
+    """
+    ProcessPoolExecutor initializer. Extractor setup and the cookie jar are
+    paid once per worker instead of once per entry, and env (the parent's
+    _env() result) seeds the worker's cache so spawned workers don't probe
+    PATH for ffmpeg and the JS runtimes again.
+    output_lock is shared by all workers so progress lines don't interleave.
+    """
+    global _WORKER_YDL, _OUTPUT_LOCK
+    import yt_dlp
+
+    _ENV_CACHE.update(env)
+    _OUTPUT_LOCK = output_lock
+    _WORKER_YDL = yt_dlp.YoutubeDL(_fetch_opts(output_dir, resolution, debug, env["ffmpeg"], transfer))  # type: ignore[arg-type]
+
+
+def _fetch_streams(url: str) -> dict[str, Any]:
+    """
+    Download the video and audio streams of one playlist entry with the
+    worker's YoutubeDL. The merge is done afterwards by _merge_streams so
+    the worker can move on to the next download straight away.
+    """
+    import yt_dlp
+
+    try:
+        info = _WORKER_YDL.extract_info(url, download=True)  # type: ignore[union-attr]
+    except yt_dlp.utils.DownloadError as e:
+        raise DownloadFailed(url, str(e)) from e
+
+    downloads = info.get("requested_downloads") or []
+    video_dl  = next((d for d in downloads if d.get("vcodec", "none") != "none"), None)
+    audio_dl  = next((d for d in downloads if d is not video_dl), None)
+    if video_dl is None:
+        raise DownloadFailed(url, "no video stream was downloaded")
+    # a combined ('best') format carries its own audio track
+    audio_codec = (audio_dl or video_dl).get("acodec")
+
+    return {
+        "url":         url,
+        "title":       info.get("title", ""),
+        "width":       video_dl.get("width"),
+        "height":      video_dl.get("height"),
+        "video_codec": video_dl.get("vcodec"),
+        "audio_codec": audio_codec if audio_codec != "none" else None,
+        "video":       video_dl["filepath"],
+        "audio":       audio_dl["filepath"] if audio_dl else None,
+    }
+
+
+def _merge_streams(streams: dict[str, Any], ffmpeg: str, threads: int) -> DownloadResult:
+    """
+    Merge the files from _fetch_streams into '<title>.mp4' with the same
+    ffmpeg arguments yt-dlp's Merger gets in download_mp4, then remove the
+    separate stream files.
+    """
+    inputs = [path for path in (streams["video"], streams["audio"]) if path]
+    # 'Title [id].f137.webm' -> 'Title [id].mp4'
+    output = Path(streams["video"]).with_suffix("").with_suffix(".mp4")
+    temp   = output.with_suffix(".temp.mp4")
+
+    cmd = [ffmpeg, "-y", "-loglevel", "error"]
+    for path in inputs:
+        cmd += [*_merger_input_args(threads), "-i", path]
+    cmd += ["-map", "0:v:0"]
+    # without a separate audio file, keep the combined stream's own audio
+    # track if it has one ('?' makes the map optional)
+    cmd += ["-map", "1:a:0" if streams["audio"] else "0:a:0?"]
+    cmd += _merger_output_args(threads, _is_aac(streams["audio_codec"]))
+    # yt-dlp's Merger adds this itself; moves the moov atom up front so the
+    # file starts playing before it is fully read.
+    cmd += ["-movflags", "+faststart", str(temp)]
+
+    proc = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True)
+    if proc.returncode != 0:
+        temp.unlink(missing_ok=True)
+        raise MergeError(proc.stderr.strip() or f"ffmpeg exited with code {proc.returncode}")
+
+    os.replace(temp, output)
+    for path in inputs:
+        Path(path).unlink(missing_ok=True)
+
+    return DownloadResult(
+        path        = output.resolve(),
+        title       = streams["title"],
+        url         = streams["url"],
+        resolution  = _resolution_str(streams),
+        video_codec = streams["video_codec"],
+        audio_codec = streams["audio_codec"],
+        filesize    = output.stat().st_size,
+    )
+
+
+def _info_opts() -> dict[str, Any]:
+    """yt-dlp options for metadata-only extraction."""
+    opts = _base_opts()
+    opts["noplaylist"] = True   # always extract single video, ignore &list= params
+    return opts
+
+
+def _fast_info_opts() -> dict[str, Any]:
+    """
+    _info_opts() minus the DASH and HLS manifests, which cost extra
+    requests and are only needed to pick download formats. Playlist URLs
+    are listed flat instead of resolving every entry.
+    """
+    opts = _info_opts()
+    opts.update({
+        "extractor_args": {"youtube": {"skip": ["dash", "hls"]}},
+        "extract_flat":   "in_playlist",
+        "check_formats":  False,
+    })
+    return opts
+
+
+def _probe_size(ydl: yt_dlp.YoutubeDL, fmt: dict[str, Any]) -> Optional[int]:
+    """
+    Size of a format from a one-byte range request: the server answers
+    'Content-Range: bytes 0-0/<total>'. Servers that ignore the range send
+    the whole body's Content-Length instead (the body is not read).
+    Fragmented formats (DASH/HLS) have no single URL to probe.
+    """
+    import yt_dlp
+    from yt_dlp.networking import Request
+
+    if fmt.get("protocol") not in ("http", "https") or not fmt.get("url"):
+        return None
+    headers = {**(fmt.get("http_headers") or {}), "Range": "bytes=0-0"}
+    try:
+        with ydl.urlopen(Request(fmt["url"], headers=headers)) as resp:
+            total = resp.headers.get("Content-Range", "").rpartition("/")[2]
+            if resp.status != 206:
+                total = resp.headers.get("Content-Length", "")
+    except yt_dlp.utils.YoutubeDLError:   # networking errors derive from it
+        return None
+    return int(total) if total.isdigit() else None
+
+
+# Per-thread YoutubeDL for get_info / get_info_many, kept for the life of
+# the thread. Its YouTube extractor holds the player code and the solved
+# n/sig challenges in memory, so later calls skip most of the JS runtime
+# work. Replaced by invalidate_env_cache().
+_info_local = threading.local()
+
+
+def _thread_info_ydl(fast: bool = False) -> yt_dlp.YoutubeDL:
+    """The calling thread's metadata YoutubeDL, built on first use."""
+    import yt_dlp
+
+    attr = "fast_ydl" if fast else "ydl"
+    ydl  = getattr(_info_local, attr, None)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(_fast_info_opts() if fast else _info_opts())  # type: ignore[arg-type]
+        setattr(_info_local, attr, ydl)
+    return ydl
+
+
+def _init_info_worker(ydls: list[yt_dlp.YoutubeDL]) -> None:
+    """ThreadPoolExecutor initializer — one YoutubeDL per worker thread."""
+    ydls.append(_thread_info_ydl())
+
+
+def _open_ydl(opts: dict[str, Any], session: Optional[YtmediaSession]) -> Any:
+    """
+    Context manager yielding a YoutubeDL for opts: the session's cached
+    one (left open on exit), or a one-shot instance closed on exit.
+    """
+    import yt_dlp
+
+    if session is not None:
+        return contextlib.nullcontext(session._ydl(opts))
+    return yt_dlp.YoutubeDL(opts)  # type: ignore[arg-type]
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
+class YtmediaSession:
+    """
+    Reusable yt-dlp state for downloading many URLs.
+
+    Passing the same session as session= to download_mp4() / download_mp3()
+    reuses one YoutubeDL per distinct set of options, so cookies, the
+    extractor instances and YouTube's player / JS challenge caches are set
+    up once instead of once per URL.
+
+    Not thread-safe — use one session per thread.
+
+    Usage
+    -----
+    with YtmediaSession() as session:
+        for url in urls:
+            download_mp4(url, session=session)
+    """
+
+    def __init__(self) -> None:
+        self._ydls: dict[str, yt_dlp.YoutubeDL] = {}
+
+    def _ydl(self, opts: dict[str, Any]) -> yt_dlp.YoutubeDL:
+        """The cached YoutubeDL for opts, built on first use."""
+        import yt_dlp
+
+        # same options -> same repr; hooks are module-level functions
+        key = repr(sorted(opts.items()))
+        ydl = self._ydls.get(key)
+        if ydl is None:
+            ydl = self._ydls[key] = yt_dlp.YoutubeDL(opts)  # type: ignore[arg-type]
+        return ydl
+
+    def close(self) -> None:
+        """Close every cached YoutubeDL (saves the cookie jar, if any)."""
+        for ydl in self._ydls.values():
+            ydl.close()
+        self._ydls.clear()
+
+    def __enter__(self) -> YtmediaSession:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
 def download_mp4(
     url: str,
     output_dir: str = "downloads",
@@ -141,6 +761,11 @@ def download_mp4(
     audio: bool = True,
     allow_playlist: bool = False,
     debug: bool = False,
+    ffmpeg_threads: Optional[int] = None,
+    info: Optional[dict[str, Any]] = None,
+    fragments: Optional[int] = None,
+    http_chunk_size: Optional[int] = _DEFAULT_HTTP_CHUNK_SIZE,
+    session: Optional[YtmediaSession] = None,
 ) -> DownloadResult:
     """
     Download a YouTube video as MP4.
@@ -153,6 +778,15 @@ def download_mp4(
     audio          : Include audio track (default True).
     allow_playlist : If True, download whole playlist. Default False.
     debug          : If True, show full yt-dlp logs.
+    ffmpeg_threads : Threads for the ffmpeg merge. Defaults to the
+                     YTMEDIA_FFMPEG_THREADS env var, else all CPUs.
+    info           : Result of get_info(url). Skips extracting the video
+                     a second time.
+    fragments      : DASH/HLS fragments downloaded in parallel. Defaults
+                     to the YTMEDIA_FRAG_CONCURRENCY env var, else 4.
+    http_chunk_size: Bytes per ranged HTTP request (default 10 MiB).
+                     None downloads each stream in a single request.
+    session        : YtmediaSession to reuse yt-dlp state across calls.
 
     Returns
     -------
@@ -164,7 +798,9 @@ def download_mp4(
     DownloadFailed      : yt-dlp could not extract or download the video
     MergeError          : ffmpeg merge step failed
     """
-    ffmpeg = find_ffmpeg()
+    import yt_dlp
+
+    ffmpeg = _env()["ffmpeg"]
 
     if audio and not ffmpeg:
         raise DependencyMissing(
@@ -175,9 +811,11 @@ def download_mp4(
 
     if ffmpeg:
         if audio:
-            fmt = ("bestvideo+bestaudio/best" if resolution == "best"
-                   else f"bestvideo[height<={resolution}]+bestaudio"
-                        f"/bestvideo[height<={resolution}]+bestaudio[ext=m4a]"
+            # m4a (AAC) audio first: the merge stream-copies it instead of
+            # transcoding Opus to AAC
+            fmt = ("bestvideo+bestaudio[ext=m4a]/bestvideo+bestaudio/best" if resolution == "best"
+                   else f"bestvideo[height<={resolution}]+bestaudio[ext=m4a]"
+                        f"/bestvideo[height<={resolution}]+bestaudio"
                         f"/best[height<={resolution}]")
         else:
             fmt = ("bestvideo/best" if resolution == "best"
@@ -186,29 +824,59 @@ def download_mp4(
         fmt = ("best[ext=mp4]/best" if resolution == "best"
                else f"best[height<={resolution}][ext=mp4]/best[height<={resolution}]/best")
 
-    opts = _ydl_opts(output_dir, debug=debug)
+    opts = _ydl_opts(output_dir, debug=debug, ffmpeg_path=ffmpeg)
     opts.update({
         "format":               fmt,
         "noplaylist":           not allow_playlist,
         "merge_output_format":  "mp4",
     })
+    opts.update(_transfer_opts(fragments, http_chunk_size))
 
+    threads = _resolve_ffmpeg_threads(ffmpeg_threads)
     if ffmpeg and audio:
-        opts["postprocessor_args"] = {
-            "merger": ["-c:v", "copy", "-c:a", "aac"]
-        }
+        opts["postprocessor_args"] = _merger_args(threads)
 
     if not debug:
-        opts["progress_hooks"] = [_progress_hook]
-        opts.update(_spinner_hooks())
+        opts["progress_hooks"]      = [_progress_hook]
+        opts["postprocessor_hooks"] = [_merge_hook]
+
+    if info is None and not allow_playlist:
+        info = get_cached_info(url)
+
+    # pick the formats before downloading when the merge could copy AAC audio
+    preselect = bool(ffmpeg) and audio and not allow_playlist
 
     try:
-        with yt_dlp.YoutubeDL(opts) as ydl:  # type: ignore[arg-type]
-            info = ydl.extract_info(url, download=True)
+        with _open_ydl(opts, session) as ydl:
+            fresh = info is None
+            if preselect and fresh:
+                info = _extract_unprocessed(ydl, url)
+            if preselect and info.get("_type", "video") == "video":  # type: ignore[union-attr]
+                # Select formats first: AAC audio is stream-copied into the
+                # MP4 instead of transcoded. The Merger reads its args from
+                # ydl.params when it runs, so they can still change here
+                # (set both ways, a session's YoutubeDL is reused).
+                info = (ydl.process_ie_result(info, download=False) if fresh
+                        else _extract(ydl, url, info, download=False))
+                if fresh and _cache_enabled():
+                    store_info(url, ydl.sanitize_info(info, remove_private_keys=True))
+                ydl.params["postprocessor_args"] = _merger_args(
+                    threads, copy_audio=_is_aac(_selected_acodec(info)))
+                info = _extract(ydl, url, info)
+            elif preselect and fresh:
+                # a playlist URL — noplaylist only applies to watch?v=...&list=...;
+                # process the listing as extracted, in one pass
+                info = ydl.process_ie_result(info, download=True)
+            else:
+                info = _extract(ydl, url, info)
     except yt_dlp.utils.DownloadError as e:
         raise DownloadFailed(url, str(e)) from e
     except yt_dlp.utils.PostProcessingError as e:
         raise MergeError(str(e)) from e
+    except yt_dlp.utils.YoutubeDLError as e:
+        # process_ie_result (info= and cached infos) raises extractor errors
+        # such as 'Requested format is not available' without wrapping them
+        raise DownloadFailed(url, str(e)) from e
 
     return _build_result(info, output_dir, url)
 
@@ -218,6 +886,11 @@ def download_mp3(
     output_dir: str = "downloads",
     quality: str = "320",
     debug: bool = False,
+    info: Optional[dict[str, Any]] = None,
+    passthrough: bool = False,
+    fragments: Optional[int] = None,
+    http_chunk_size: Optional[int] = _DEFAULT_HTTP_CHUNK_SIZE,
+    session: Optional[YtmediaSession] = None,
 ) -> DownloadResult:
     """
     Download and extract audio as MP3.
@@ -228,6 +901,16 @@ def download_mp3(
     output_dir : Folder to save the file (created if needed).
     quality    : Bitrate in kbps — '320', '192', '128' (default '320').
     debug      : If True, show full yt-dlp logs.
+    info       : Result of get_info(url). Skips extracting the video
+                 a second time.
+    passthrough: If True, keep the source audio codec instead of
+                 re-encoding to MP3 — AAC is saved as .m4a, Opus as
+                 .opus. No transcode, no size bloat; quality is ignored.
+    fragments  : DASH/HLS fragments downloaded in parallel. Defaults to
+                 the YTMEDIA_FRAG_CONCURRENCY env var, else 4.
+    http_chunk_size: Bytes per ranged HTTP request (default 10 MiB).
+                 None downloads the stream in a single request.
+    session    : YtmediaSession to reuse yt-dlp state across calls.
 
     Returns
     -------
@@ -238,60 +921,107 @@ def download_mp3(
     DependencyMissing : ffmpeg not available (required for MP3 conversion)
     DownloadFailed    : yt-dlp could not extract or download
     """
-    if not find_ffmpeg():
+    import yt_dlp
+
+    ffmpeg = _env()["ffmpeg"]
+    if not ffmpeg:
         raise DependencyMissing(
             "ffmpeg",
             "ffmpeg is required for MP3 conversion. "
             "Run `ytmedia doctor` or install ffmpeg manually."
         )
 
-    opts = _ydl_opts(output_dir, debug=debug)
+    opts = _ydl_opts(output_dir, debug=debug, ffmpeg_path=ffmpeg)
+    # preferredcodec 'best' makes yt-dlp stream-copy the audio into the
+    # container that matches its codec
+    extract_audio = ({"key": "FFmpegExtractAudio", "preferredcodec": "best"} if passthrough
+                     else {"key": "FFmpegExtractAudio", "preferredcodec": "mp3",
+                           "preferredquality": quality})
     opts.update({
-        "format":      "bestaudio/best",
-        "noplaylist":  True,
-        "postprocessors": [{
-            "key":              "FFmpegExtractAudio",
-            "preferredcodec":   "mp3",
-            "preferredquality": quality,
-        }],
+        "format":         "bestaudio/best",
+        "noplaylist":     True,
+        "postprocessors": [extract_audio],
     })
+    opts.update(_transfer_opts(fragments, http_chunk_size))
 
     if not debug:
         opts["progress_hooks"] = [_progress_hook]
 
+    if info is None:
+        info = get_cached_info(url)
+
     try:
-        with yt_dlp.YoutubeDL(opts) as ydl:  # type: ignore[arg-type]
-            info = ydl.extract_info(url, download=True)
-    except yt_dlp.utils.DownloadError as e:
+        with _open_ydl(opts, session) as ydl:
+            info = _extract(ydl, url, info)
+    except yt_dlp.utils.YoutubeDLError as e:   # DownloadError, and unwrapped ExtractorError
         raise DownloadFailed(url, str(e)) from e
 
     title    = info.get("title", "download")
-    mp3_path = (Path(output_dir) / title).with_suffix(".mp3").resolve()
+    # the extracted file's path, as left by FFmpegExtractAudio
+    filepath = (info.get("requested_downloads") or [{}])[-1].get("filepath")
+    mp3_path = (Path(filepath) if filepath
+                else (Path(output_dir) / title).with_suffix(".mp3")).resolve()
 
     return DownloadResult(
         path        = mp3_path,
         title       = title,
         url         = url,
-        audio_codec = "mp3",
+        audio_codec = info.get("acodec") if passthrough else "mp3",
         filesize    = info.get("filesize") or info.get("filesize_approx"),
     )
 
 
+# next() default marking the end of _iter_playlist_entries, whose entries
+# may themselves be None
+_END_OF_PLAYLIST = object()
+
+
 def download_playlist_mp4(
     playlist_url: str,
     output_dir: str = "downloads",
     resolution: str = "best",
     debug: bool = False,
+    workers: int = 4,
+    ffmpeg_threads: Optional[int] = None,
+    chunk_size: int = 20,
+    fragments: Optional[int] = None,
+    http_chunk_size: Optional[int] = _DEFAULT_HTTP_CHUNK_SIZE,
 ) -> PlaylistResult:
     """
     Download all videos in a YouTube playlist as MP4.
 
+    The playlist is listed lazily without resolving formats, and entries
+    go to a pool of worker processes as a sliding window of chunk_size
+    downloads: each finished download makes room for the next entry. The
+    workers download each video's streams, while finished downloads are
+    merged by ffmpeg one at a time in the background — the network and
+    the CPU are busy at the same time instead of taking turns.
+
+    Files are saved as 'Title [video id].mp4'. Videos whose file is
+    already in output_dir are not downloaded again, and a video listed
+    more than once is downloaded once.
+
+    On Windows and macOS worker processes are spawned, which re-imports
+    the calling script: call this from under `if __name__ == "__main__":`,
+    or the workers fail to start.
+
     Parameters
     ----------
-    playlist_url : YouTube playlist URL.
-    output_dir   : Folder to save files.
-    resolution   : 'best' or a height string like '1080'.
-    debug        : If True, show full yt-dlp logs.
+    playlist_url   : YouTube playlist URL.
+    output_dir     : Folder to save files.
+    resolution     : 'best' or a height string like '1080'.
+    debug          : If True, show full yt-dlp logs.
+    workers        : Number of videos downloaded in parallel (capped at 5
+                     and at the CPU count).
+    ffmpeg_threads : Threads for each ffmpeg merge. Defaults to the
+                     YTMEDIA_FFMPEG_THREADS env var, else all CPUs.
+    chunk_size     : Most downloads queued at once. Bounds the work in
+                     flight on very large playlists.
+    fragments      : DASH/HLS fragments downloaded in parallel per video.
+                     Defaults to the YTMEDIA_FRAG_CONCURRENCY env var,
+                     else 4.
+    http_chunk_size: Bytes per ranged HTTP request (default 10 MiB).
+                     None downloads each stream in a single request.
 
     Returns
     -------
@@ -302,44 +1032,125 @@ def download_playlist_mp4(
     DependencyMissing : ffmpeg not available
     DownloadFailed    : entire playlist extraction failed
     """
-    if not find_ffmpeg():
+    env    = _env()
+    ffmpeg = env["ffmpeg"]
+    if not ffmpeg:
         raise DependencyMissing(
             "ffmpeg",
             "ffmpeg is required for audio+video merging. "
             "Run `ytmedia doctor` or install ffmpeg manually."
         )
 
-    fmt = ("bestvideo+bestaudio/best" if resolution == "best"
-           else f"bestvideo[height<={resolution}]+bestaudio"
-                f"/bestvideo[height<={resolution}]+bestaudio[ext=m4a]"
-                f"/best[height<={resolution}]")
+    # Created without the _CREATED_DIRS shortcut — the folder may have been
+    # deleted since an earlier call, and _existing_outputs lists it below.
+    # Done before the pool starts, so forked workers inherit _CREATED_DIRS
+    # and a bad output_dir fails before the playlist is listed.
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    _CREATED_DIRS.add(output_dir)
 
-    opts = _ydl_opts(output_dir, debug=debug)
-    opts.update({
-        "format":              fmt,
-        "merge_output_format": "mp4",
-        "ignoreerrors":        True,   # skip unavailable videos, don't abort
-        "postprocessor_args":  {"merger": ["-c:v", "copy", "-c:a", "aac"]},
-    })
+    # each worker is a process that also runs the JS challenge solver, so
+    # more workers than CPUs only adds contention
+    workers    = max(1, min(workers, _MAX_PLAYLIST_WORKERS, os.cpu_count() or 1))
+    chunk_size = max(1, chunk_size)
+    threads = _resolve_ffmpeg_threads(ffmpeg_threads, n_workers=_MERGE_SLOTS)
+    result  = PlaylistResult()
 
-    if not debug:
-        opts["progress_hooks"] = [_progress_hook]
-        opts.update(_spinner_hooks())
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_playlist_worker,
+        initargs=(output_dir, resolution, debug, env,
+                  _transfer_opts(fragments, http_chunk_size), multiprocessing.Lock()),
+    )
+    # Entries finish out of order; both lists are keyed by playlist index
+    # and sorted at the end so results follow the playlist.
+    done:   list[tuple[int, DownloadResult]] = []
+    failed: list[tuple[int, str]]            = []
+    # A video listed twice is downloaded once; the repeat gets the first
+    # occurrence's outcome: (repeat index, first index, url).
+    first_index: dict[str, int]            = {}
+    repeats:     list[tuple[int, int, str]] = []
+    existing = _existing_outputs(output_dir)
 
+    merger = ThreadPoolExecutor(max_workers=_MERGE_SLOTS)
     try:
-        with yt_dlp.YoutubeDL(opts) as ydl:  # type: ignore[arg-type]
-            info = ydl.extract_info(playlist_url, download=True)
-    except yt_dlp.utils.DownloadError as e:
-        raise DownloadFailed(playlist_url, str(e)) from e
+        entries   = _iter_playlist_entries(playlist_url, debug=debug)
+        listing   = True
+        downloads = {}
+        merges    = {}
+
+        def settle(futures):
+            for future in futures:
+                index_url = merges.pop(future)
+                try:
+                    done.append((index_url[0], future.result()))
+                except YtMediaError:
+                    failed.append(index_url)
+
+        while listing or downloads:
+            # Top the window back up to chunk_size downloads, so a slow
+            # video holds up one slot instead of a whole batch.
+            while listing and len(downloads) < chunk_size:
+                entry = next(entries, _END_OF_PLAYLIST)
+                if entry is _END_OF_PLAYLIST:
+                    listing = False
+                    break
+                index = result.total
+                result.total += 1
+                if entry is None:
+                    # unavailable entries come back from the flat listing without a URL
+                    failed.append((index, "unknown"))
+                    continue
+                url, video_id = entry["url"], entry.get("id")
+                if video_id in existing:
+                    done.append((index, _existing_result(existing[video_id], entry)))
+                    continue
+                if video_id in first_index:
+                    repeats.append((index, first_index[video_id], url))
+                    continue
+                if video_id:
+                    first_index[video_id] = index
+                downloads[pool.submit(_fetch_streams, url)] = (index, url)
 
-    result = PlaylistResult(total=len(info.get("entries", [])))
+            if not downloads:
+                continue
+            finished, _ = wait(downloads, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index_url = downloads.pop(future)
+                try:
+                    streams = future.result()
+                except YtMediaError:
+                    failed.append(index_url)
+                    continue
+                merges[merger.submit(_merge_streams, streams, ffmpeg, threads)] = index_url
 
-    for entry in info.get("entries", []):
-        if entry:
-            result.downloads.append(_build_result(entry, output_dir, entry.get("webpage_url", "")))
+            # When ffmpeg is the bottleneck, stop dispatching downloads once
+            # more than `workers` merges are queued, so unmerged stream
+            # files don't pile up in output_dir.
+            settle([future for future in merges if future.done()])
+            while len(merges) > workers:
+                settle(wait(merges, return_when=FIRST_COMPLETED).done)
+
+        settle(list(as_completed(merges)))
+    except BaseException:
+        # Ctrl+C or an unexpected error: drop the queued downloads and merges
+        # instead of letting a blocking shutdown work through the window.
+        pool.shutdown(wait=False, cancel_futures=True)
+        merger.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+    merger.shutdown()
+
+    by_index = dict(done)
+    for index, first, url in repeats:
+        if first in by_index:
+            done.append((index, by_index[first]))
         else:
-            result.failed.append("unknown")
+            failed.append((index, url))
 
+    done.sort(key=lambda item: item[0])
+    failed.sort()
+    result.downloads = [download for _, download in done]
+    result.failed    = [url for _, url in failed]
     return result
 
 
@@ -347,6 +1158,17 @@ def get_info(url: str) -> dict[str, Any]:
     """
     Fetch metadata for a YouTube URL without downloading.
 
+    Repeated calls from the same thread share one YoutubeDL, so YouTube's
+    player JS is fetched and its challenges solved once rather than per
+    call.
+
+    The full yt-dlp info dict is returned unmodified, so it can be passed
+    as info= to download_mp4() / download_mp3() to download without
+    extracting the video again.
+
+    With the optional diskcache dependency (ytmedia[cache]) results are
+    also cached on disk for an hour, keyed by video id.
+
     Returns
     -------
     dict with keys: title, uploader, duration, formats, thumbnails, etc.
@@ -355,17 +1177,148 @@ def get_info(url: str) -> dict[str, Any]:
     ------
     DownloadFailed : could not extract info
     """
-    opts: dict[str, Any] = {"quiet": True, "no_warnings": True}
-    runtimes = get_js_runtimes()
-    if runtimes:
-        opts["js_runtimes"] = {
-            name: {"executable": path} for name, path in runtimes.items()
-        }
+    import yt_dlp
 
-    opts["noplaylist"] = True   # always extract single video, ignore &list= params
+    cached = get_cached_info(url)
+    if cached is not None:
+        return cached
+    ydl = _thread_info_ydl()
+    try:
+        info = ydl.extract_info(url, download=False)
+    except yt_dlp.utils.DownloadError as e:
+        raise DownloadFailed(url, str(e)) from e
+    if _cache_enabled():
+        store_info(url, ydl.sanitize_info(info))
+    return info  # type: ignore[return-value]
+
+
+def get_info_fast(url: str) -> dict[str, Any]:
+    """
+    Fetch display metadata (title, uploader, duration, ...) quickly.
+
+    Like get_info(), but skips the DASH and HLS manifests, so the result
+    lists fewer formats. Use get_info() when the result will be passed
+    as info= to a download function.
+
+    Raises
+    ------
+    DownloadFailed : could not extract info
+    """
+    import yt_dlp
+
+    try:
+        return _thread_info_ydl(fast=True).extract_info(url, download=False)  # type: ignore[return-value]
+    except yt_dlp.utils.DownloadError as e:
+        raise DownloadFailed(url, str(e)) from e
+
+
+def get_size(url: str) -> Optional[int]:
+    """
+    Size in bytes of the streams download_mp4(url) would fetch, without
+    downloading them.
+
+    Skips the DASH/HLS manifests like get_info_fast(). Sizes YouTube
+    reports for a format are used as-is; the rest are read from a
+    one-byte range request per stream.
 
+    Returns
+    -------
+    int, or None if a stream's size can't be determined
+
+    Raises
+    ------
+    DownloadFailed : could not extract info
+    """
+    import yt_dlp
+
+    opts = _fast_info_opts()
+    opts["format"] = "bestvideo+bestaudio[ext=m4a]/bestvideo+bestaudio/best"
     try:
         with yt_dlp.YoutubeDL(opts) as ydl:  # type: ignore[arg-type]
-            return ydl.extract_info(url, download=False)  # type: ignore[return-value]
+            info  = ydl.extract_info(url, download=False)
+            total = 0
+            for fmt in info.get("requested_formats") or [info]:
+                size = fmt.get("filesize") or _probe_size(ydl, fmt)
+                if not size:
+                    return None
+                total += size
+            return total
     except yt_dlp.utils.DownloadError as e:
-        raise DownloadFailed(url, str(e)) from e
\ No newline at end of file
+        raise DownloadFailed(url, str(e)) from e
+
+
+def get_info_many(urls: list[str], max_workers: int = 8) -> list[dict[str, Any]]:
+    """
+    Fetch metadata for many URLs concurrently.
+
+    Extraction is network-bound, so a thread pool gives close to linear
+    speedup until bandwidth or YouTube rate limits kick in. Each worker
+    thread keeps one YoutubeDL for all the URLs it handles, and runs its
+    own JS runtime calls for challenge solving.
+
+    Parameters
+    ----------
+    urls        : YouTube video URLs.
+    max_workers : Number of concurrent extractions (default 8).
+
+    Returns
+    -------
+    list of info dicts, in the same order as urls
+
+    Raises
+    ------
+    DownloadFailed : extraction failed for one of the URLs
+    """
+    ydls: list[yt_dlp.YoutubeDL] = []
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                initializer=_init_info_worker, initargs=(ydls,)) as pool:
+            return list(pool.map(get_info, urls))
+    finally:
+        for ydl in ydls:
+            ydl.close()
+
+
+async def get_info_many_async(urls: list[str], concurrency: int = 8) -> list[dict[str, Any]]:
+    """
+    Async get_info_many() — fetch metadata for many URLs concurrently
+    without blocking the event loop.
+
+    Each get_info() call runs in the loop's default thread pool via
+    asyncio.to_thread, with at most `concurrency` in flight. Pool threads
+    keep their YoutubeDL across calls, like get_info() in any thread.
+
+    Parameters
+    ----------
+    urls        : YouTube video URLs.
+    concurrency : Maximum number of concurrent extractions (default 8).
+
+    Returns
+    -------
+    list of info dicts, in the same order as urls
+
+    Raises
+    ------
+    DownloadFailed : extraction failed for one of the URLs
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(url: str) -> dict[str, Any]:
+        async with semaphore:
+            return await asyncio.to_thread(get_info, url)
+
+    return list(await asyncio.gather(*(fetch(url) for url in urls)))
+
+
+def invalidate_env_cache() -> None:
+    """
+    Forget the detected ffmpeg and JS runtime paths, in memory and in the
+    saved env.json, so the next call probes PATH again. Use after
+    installing a dependency mid-process.
+    """
+    global _info_local
+    _ENV_CACHE.clear()
+    _info_local = threading.local()   # drop YoutubeDLs built with the old paths
+    clear_env_cache()
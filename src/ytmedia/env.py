@@ -2,13 +2,99 @@
 env.py
 ======
 Environment detection helpers.
-Results are cached at module level so detection only runs once per process.
+Results are cached at module level so detection only runs once per process,
+and binary paths found on PATH are saved to <cache dir>/env.json so later
+processes started with the same PATH only check that the file is still
+executable.
 """
 
+import contextlib
 import functools
+import importlib.util
+import json
+import os
 import shutil
+import sys
 from typing import Optional
 
+from .cache import CACHE_DIR
+
+_ENV_FILE = os.path.join(CACHE_DIR, "env.json")
+
+
+@functools.lru_cache(maxsize=None)
+def _persisted() -> dict[str, str]:
+    """
+    Binary paths saved in _ENV_FILE by an earlier process, if it ran with
+    the same PATH; otherwise just {'PATH': <current PATH>}. Updated in
+    place by _remember().
+    """
+    path_var = os.environ.get("PATH", "")
+    try:
+        with open(_ENV_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = None
+    if not isinstance(data, dict) or data.get("PATH") != path_var:
+        data = {"PATH": path_var}
+    return data
+
+
+def _persisted_path(name: str) -> Optional[str]:
+    """Saved path of binary name, if there is one and it is still executable."""
+    path = _persisted().get(name)
+    return path if path and os.path.isfile(path) and os.access(path, os.X_OK) else None
+
+
+def _remember(name: str, path: Optional[str]) -> Optional[str]:
+    """Save a found binary path to _ENV_FILE and return it. None is not saved."""
+    if path:
+        data = _persisted()
+        data[name] = path
+        tmp = f"{_ENV_FILE}.{os.getpid()}.tmp"
+        with contextlib.suppress(OSError):   # read-only home: just don't persist
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, _ENV_FILE)
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _path_index() -> dict[str, tuple[str, ...]]:
+    """
+    Map each file name on PATH to its full paths, in PATH order, from a
+    single os.scandir() pass over every PATH directory — so looking up
+    ffmpeg, node and deno walks PATH once instead of once per binary.
+    On Windows names are lower-cased and also indexed without their
+    PATHEXT suffix ('node.exe' -> 'node').
+    """
+    windows  = sys.platform == "win32"
+    suffixes = tuple(
+        ext.lower() for ext in os.environ.get("PATHEXT", ".EXE;.BAT;.CMD").split(os.pathsep) if ext
+    ) if windows else ()
+
+    index: dict[str, list[str]] = {}
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        try:
+            entries = list(os.scandir(directory or os.curdir))
+        except OSError:
+            continue
+        for entry in entries:
+            name = entry.name.lower() if windows else entry.name
+            index.setdefault(name, []).append(entry.path)
+            if windows and name.endswith(suffixes):
+                index.setdefault(os.path.splitext(name)[0], []).append(entry.path)
+    return {name: tuple(paths) for name, paths in index.items()}
+
+
+def _which(name: str) -> Optional[str]:
+    """shutil.which() backed by _path_index(): first executable file named name."""
+    for path in _path_index().get(name.lower() if sys.platform == "win32" else name, ()):
+        if os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
+    return None
+
 
 @functools.lru_cache(maxsize=None)
 def find_ffmpeg() -> Optional[str]:
@@ -16,17 +102,21 @@ def find_ffmpeg() -> Optional[str]:
     Return the path to ffmpeg if available on PATH, else None.
     Result is cached — detection only runs once per process.
     """
-      # Check system PATH first — no download needed if already installed
-    found = shutil.which("ffmpeg")
+    # Check system PATH first — no download needed if already installed
+    found = _persisted_path("ffmpeg") or _remember("ffmpeg", _which("ffmpeg"))
     if found:
         return found
 
-    # Only fall back to static_ffmpeg if system ffmpeg is missing
-    try:
-        import static_ffmpeg
-        static_ffmpeg.add_paths()
-    except ImportError:
-        pass
+    # Only fall back to static_ffmpeg if system ffmpeg is missing, it is
+    # installed, and YTMEDIA_USE_STATIC_FFMPEG=0 hasn't turned it off.
+    # Its path is not saved: the env var is checked again next run, and a
+    # system ffmpeg installed later takes over.
+    if os.environ.get("YTMEDIA_USE_STATIC_FFMPEG", "1") != "1":
+        return None
+    if importlib.util.find_spec("static_ffmpeg") is None:
+        return None
+    import static_ffmpeg
+    static_ffmpeg.add_paths()   # prepends to PATH, which _path_index() has already read
     return shutil.which("ffmpeg")
 
 
@@ -36,7 +126,7 @@ def find_node() -> Optional[str]:
     Return the path to node if available on PATH, else None.
     Result is cached — detection only runs once per process.
     """
-    return shutil.which("node") or shutil.which("node.exe")
+    return _persisted_path("node") or _remember("node", _which("node") or _which("node.exe"))
 
 
 @functools.lru_cache(maxsize=None)
@@ -45,7 +135,7 @@ def find_deno() -> Optional[str]:
     Return the path to deno if available on PATH, else None.
     Result is cached — detection only runs once per process.
     """
-    return shutil.which("deno")
+    return _persisted_path("deno") or _remember("deno", _which("deno"))
 
 
 def has_ffmpeg() -> bool:
@@ -73,6 +163,31 @@ def get_js_runtimes() -> dict[str, str]:
     return runtimes
 
 
+@functools.lru_cache(maxsize=None)
+def get_ytdlp_js_runtimes() -> dict[str, dict[str, str]]:
+    """
+    get_js_runtimes() in the shape of yt-dlp's 'js_runtimes' option,
+    e.g. {'node': {'path': '/usr/bin/node'}}.
+    Result is cached — detection only runs once per process.
+    """
+    return {name: {"path": path} for name, path in get_js_runtimes().items()}
+
+
+def clear_env_cache() -> None:
+    """
+    Forget every detected path — the per-process caches and the saved
+    env.json — so the next lookups probe PATH again.
+    """
+    _persisted.cache_clear()
+    with contextlib.suppress(OSError):
+        os.remove(_ENV_FILE)
+    _path_index.cache_clear()
+    find_ffmpeg.cache_clear()
+    find_node.cache_clear()
+    find_deno.cache_clear()
+    get_ytdlp_js_runtimes.cache_clear()
+
+
 def get_missing_dependencies() -> list[str]:
     """
     Return a list of missing required dependencies.
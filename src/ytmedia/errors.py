@@ -21,8 +21,13 @@ class DependencyMissing(YtMediaError):
     """
     def __init__(self, dependency: str, message: str = "") -> None:
         self.dependency = dependency
+        self.message    = message
         super().__init__(message or f"Missing dependency: {dependency}")
 
+    def __reduce__(self):
+        # keep attributes intact when raised inside a worker process
+        return type(self), (self.dependency, self.message)
+
 
 class DownloadFailed(YtMediaError):
     """
@@ -33,9 +38,14 @@ class DownloadFailed(YtMediaError):
     url : the URL that failed
     """
     def __init__(self, url: str, reason: str = "") -> None:
-        self.url = url
+        self.url    = url
+        self.reason = reason
         super().__init__(f"Download failed for {url!r}: {reason}" if reason else f"Download failed for {url!r}")
 
+    def __reduce__(self):
+        # keep attributes intact when raised inside a worker process
+        return type(self), (self.url, self.reason)
+
 
 class UnsupportedFormat(YtMediaError):
     """Requested format or resolution is not available for this video."""
@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadResult:
     """
     Result of a single video or audio download.
@@ -42,7 +42,7 @@ class DownloadResult:
         return " ".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistResult:
     """
     Result of a playlist download.
@@ -50,7 +50,8 @@ class PlaylistResult:
     Attributes
     ----------
     downloads   : list of successfully downloaded DownloadResult objects
-    failed      : list of URLs that failed (skipped due to ignoreerrors)
+    failed      : list of URLs that failed, in playlist order ('unknown' for
+                  entries listed without a URL)
     total       : total number of entries attempted
     """
     downloads:  list[DownloadResult] = field(default_factory=list)
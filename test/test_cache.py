@@ -0,0 +1,57 @@
+"""
+test_cache.py
+=============
+Offline tests for the metadata cache keys and playlist handling.
+"""
+
+import pytest
+
+from ytmedia import cache
+
+
+@pytest.mark.parametrize("url, key", [
+    ("https://youtu.be/abc123",                                "info:abc123"),
+    ("https://youtu.be/abc123?t=30",                           "info:abc123"),
+    ("https://www.youtube.com/watch?v=abc123",                 "info:abc123"),
+    ("https://youtube.com/watch?v=abc123&list=PLx&index=3",    "info:abc123"),
+    ("https://m.youtube.com/watch?t=5&v=abc123",               "info:abc123"),
+    ("https://music.youtube.com/watch?v=abc123",               "info:abc123"),
+    ("https://www.youtube.com/shorts/abc123",                  "info:abc123"),
+    ("https://www.youtube.com/live/abc123?si=share",           "info:abc123"),
+    ("https://WWW.YOUTUBE.COM/watch?v=abc123",                 "info:abc123"),
+])
+def test_cache_key_uses_video_id(url, key):
+    assert cache.cache_key(url) == key
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.youtube.com/playlist?list=PLx",
+    "https://www.youtube.com/@channel",
+    "https://vimeo.com/12345",
+])
+def test_cache_key_falls_back_to_url(url):
+    assert cache.cache_key(url) == f"info:{url}"
+
+
+class _DictCache(dict):
+    """Stand-in for diskcache.Cache."""
+
+    def set(self, key, value, expire=None):
+        self[key] = value
+
+
+def test_store_info_skips_playlists(monkeypatch):
+    store = _DictCache()
+    monkeypatch.setattr(cache, "_open", lambda: store)
+
+    cache.store_info("https://youtu.be/abc123", {"id": "abc123", "_type": "video"})
+    cache.store_info("https://www.youtube.com/playlist?list=PLx", {"id": "PLx", "_type": "playlist"})
+
+    assert list(store) == ["info:abc123"]
+
+
+def test_get_cached_info_ignores_non_dict_values(monkeypatch):
+    store = _DictCache({"info:abc123": b'{"id": "abc123"}'})
+    monkeypatch.setattr(cache, "_open", lambda: store)
+
+    assert cache.get_cached_info("https://youtu.be/abc123") is None
@@ -0,0 +1,139 @@
+"""
+test_cli.py
+===========
+Offline tests for the install-deps and info commands. pip, input(),
+static_ffmpeg and the download functions are faked.
+"""
+
+import subprocess
+import sys
+import types
+
+import pytest
+
+from ytmedia import cli
+from ytmedia.models import DownloadResult
+
+
+def _run(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["ytmedia", *argv])
+    cli.main()
+
+
+# ---------------------------------------------------------------------------
+# install-deps
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def installer(monkeypatch):
+    """
+    Fake pip, input() and static_ffmpeg for cmd_install_deps. Set
+    'installed', 'ffmpeg' (find_ffmpeg results in call order), 'choice'
+    and 'pip_fails'; pip commands and add_paths() calls are recorded.
+    """
+    state = {"installed": set(), "ffmpeg": [None], "choice": "s", "pip_fails": False,
+             "pip": [], "add_paths": 0, "prompts": 0}
+
+    def check_call(cmd, **kwargs):
+        state["pip"].append(cmd)
+        if state["pip_fails"]:
+            raise subprocess.CalledProcessError(1, cmd)
+        return 0
+
+    def ask(prompt):
+        state["prompts"] += 1
+        return state["choice"]
+
+    def add_paths():
+        state["add_paths"] += 1
+
+    monkeypatch.setattr(subprocess, "check_call", check_call)
+    monkeypatch.setattr("builtins.input", ask)
+    monkeypatch.setattr(cli, "_is_installed", lambda package: package in state["installed"])
+    monkeypatch.setattr(cli, "find_ffmpeg", lambda: state["ffmpeg"].pop(0))
+    monkeypatch.setattr(cli, "invalidate_env_cache", lambda: None)
+    monkeypatch.setattr(cli, "get_js_runtimes", lambda: {"node": "/usr/bin/node"})
+    monkeypatch.setitem(sys.modules, "static_ffmpeg", types.SimpleNamespace(add_paths=add_paths))
+    return state
+
+
+def test_install_deps_batches_pip_install(installer, monkeypatch, capsys):
+    installer["ffmpeg"] = [None, "/venv/bin/ffmpeg"]
+    installer["choice"] = "1"
+
+    _run(monkeypatch, "install-deps")
+
+    assert installer["pip"] == [[sys.executable, "-m", "pip", "install", "yt-dlp-ejs", "static-ffmpeg"]]
+    assert installer["add_paths"] == 1
+    assert "installed at /venv/bin/ffmpeg" in capsys.readouterr().out
+
+
+def test_install_deps_nothing_missing(installer, monkeypatch, capsys):
+    installer["installed"] = {"yt-dlp-ejs"}
+    installer["ffmpeg"]    = ["/usr/bin/ffmpeg"]
+
+    _run(monkeypatch, "install-deps")
+
+    assert installer["pip"] == []
+    assert installer["prompts"] == 0
+    assert "already found at /usr/bin/ffmpeg" in capsys.readouterr().out
+
+
+def test_install_deps_pip_failure_skips_static_ffmpeg(installer, monkeypatch, capsys):
+    installer["installed"] = {"yt-dlp-ejs"}
+    installer["choice"]    = "1"
+    installer["pip_fails"] = True
+
+    _run(monkeypatch, "install-deps")
+
+    assert installer["pip"] == [[sys.executable, "-m", "pip", "install", "static-ffmpeg"]]
+    assert installer["add_paths"] == 0
+    out = capsys.readouterr().out
+    assert "[pip]        failed" in out and "System-wide install" in out
+
+
+# ---------------------------------------------------------------------------
+# info
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def info_calls(monkeypatch):
+    """Fake metadata and download functions; records (name, url, kwargs)."""
+    calls = []
+    info  = {"title": "T", "uploader": "U", "duration": 5, "webpage_url": "https://y/watch?v=a",
+             "formats": [{}, {}]}
+
+    def fake(name, result=None):
+        def call(url, **kwargs):
+            calls.append((name, url, kwargs))
+            return result
+        return call
+
+    saved = DownloadResult(path="/out/T.mp4", title="T", url="https://y/watch?v=a")
+    monkeypatch.setattr(cli, "get_info",      fake("get_info", info))
+    monkeypatch.setattr(cli, "get_info_fast", fake("get_info_fast", info))
+    monkeypatch.setattr(cli, "download_mp4",  fake("download_mp4", saved))
+    monkeypatch.setattr(cli, "download_mp3",  fake("download_mp3", saved))
+    return calls, info
+
+
+def test_info_uses_fast_metadata(info_calls, monkeypatch, capsys):
+    calls, _ = info_calls
+
+    _run(monkeypatch, "info", "https://y/watch?v=a")
+
+    assert [name for name, _, _ in calls] == ["get_info_fast"]
+    assert "Available formats: 2" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("mode", ["mp4", "mp3"])
+def test_info_download_reuses_metadata(info_calls, monkeypatch, capsys, mode):
+    calls, info = info_calls
+
+    _run(monkeypatch, "info", "https://y/watch?v=a", "--download", mode, "-o", "out")
+
+    assert [name for name, _, _ in calls] == ["get_info", f"download_{mode}"]
+    kwargs = calls[1][2]
+    assert kwargs["info"] is info
+    assert kwargs["output_dir"] == "out"
+    assert "Saved: " in capsys.readouterr().out
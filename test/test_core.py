@@ -0,0 +1,581 @@
+"""
+test_core.py
+============
+Offline tests for core.py: option precedence, progress formatting,
+playlist bookkeeping and info reuse. No network access and no ffmpeg —
+yt-dlp's extraction and download steps are faked.
+"""
+
+import asyncio
+import copy
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import yt_dlp
+
+from ytmedia import core
+from ytmedia.errors import DownloadFailed, MergeError
+from ytmedia.models import DownloadResult
+
+
+# ---------------------------------------------------------------------------
+# argument > environment variable > default
+# ---------------------------------------------------------------------------
+
+def test_resolve_fragments(monkeypatch):
+    monkeypatch.delenv("YTMEDIA_FRAG_CONCURRENCY", raising=False)
+    assert core._resolve_fragments(None) == core._DEFAULT_FRAGMENTS
+
+    monkeypatch.setenv("YTMEDIA_FRAG_CONCURRENCY", "12")
+    assert core._resolve_fragments(None) == 12
+    assert core._resolve_fragments(0) == 12
+    assert core._resolve_fragments(3) == 3
+
+    for bad in ("0", "-2", "many", ""):
+        monkeypatch.setenv("YTMEDIA_FRAG_CONCURRENCY", bad)
+        assert core._resolve_fragments(None) == core._DEFAULT_FRAGMENTS
+
+
+def test_resolve_ffmpeg_threads(monkeypatch):
+    monkeypatch.delenv("YTMEDIA_FFMPEG_THREADS", raising=False)
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    assert core._resolve_ffmpeg_threads(None) == 8
+    assert core._resolve_ffmpeg_threads(None, n_workers=3) == 2
+    assert core._resolve_ffmpeg_threads(None, n_workers=16) == 1
+
+    monkeypatch.setenv("YTMEDIA_FFMPEG_THREADS", "5")
+    assert core._resolve_ffmpeg_threads(None, n_workers=3) == 5
+    assert core._resolve_ffmpeg_threads(2) == 2
+
+    monkeypatch.setenv("YTMEDIA_FFMPEG_THREADS", "zero")
+    assert core._resolve_ffmpeg_threads(None) == 8
+
+
+# ---------------------------------------------------------------------------
+# progress line
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("n, text", [
+    (None,             "?"),
+    (0,                "?"),
+    (512,              "512.00B"),
+    (1536,             "1.50KiB"),
+    (10 * 1024 ** 2,   "10.00MiB"),
+    (3 * 1024 ** 4,    "3.00TiB"),
+    (2048 * 1024 ** 4, "2048.00TiB"),
+])
+def test_fmt_bytes(n, text):
+    assert core._fmt_bytes(n) == text
+
+
+@pytest.fixture
+def progress_state(monkeypatch):
+    monkeypatch.setattr(core, "_LAST_FLUSH", {})
+    monkeypatch.setattr(core, "_LABEL_CACHE", {})
+
+
+def test_progress_hook_line(progress_state, capsys):
+    core._progress_hook({
+        "status":           "downloading",
+        "filename":         "Title.f137.mp4",
+        "downloaded_bytes": 512 * 1024,
+        "total_bytes":      1024 * 1024,
+        "speed":            2 * 1024 * 1024,
+        "eta":              65,
+    })
+    out = capsys.readouterr().out
+    assert out.startswith("\x1b[2K\r")
+    assert "[video]" in out
+    assert "50.0% of    1.00MiB at    2.00MiB/s  ETA 01:05" in out
+    assert not out.endswith("\n")
+
+
+def test_progress_hook_unknown_fields(progress_state, capsys):
+    core._progress_hook({"status": "downloading", "filename": "Title.f251.webm"})
+    out = capsys.readouterr().out
+    assert "[audio]" in out
+    assert "?% of          ? at            ?  ETA ?" in out
+
+
+def test_progress_hook_throttles_and_finishes(progress_state, capsys):
+    tick = {"status": "downloading", "filename": "a.mp4", "downloaded_bytes": 1, "total_bytes": 10}
+    core._progress_hook(tick)
+    core._progress_hook(tick)   # within _PROGRESS_INTERVAL: not drawn
+    assert capsys.readouterr().out.count("\r") == 1
+    assert "a.mp4" in core._LABEL_CACHE
+
+    core._progress_hook({"status": "finished", "filename": "a.mp4", "total_bytes": 10})
+    out = capsys.readouterr().out
+    assert "100%" in out and out.endswith("\n")
+    assert "a.mp4" not in core._LABEL_CACHE and "a.mp4" not in core._LAST_FLUSH
+
+
+# ---------------------------------------------------------------------------
+# download_playlist_mp4 bookkeeping (pool and helpers faked)
+# ---------------------------------------------------------------------------
+
+def _entry(video_id, title=None):
+    return {"url": f"https://youtu.be/{video_id}", "id": video_id, "title": title or video_id}
+
+
+@pytest.fixture
+def fake_playlist(monkeypatch):
+    """
+    Run download_playlist_mp4 on threads with fake fetch / merge steps.
+    Entries are given as the 'entries' list; ids in 'fetch_fails' /
+    'merge_fails' fail at that step. Returns the state dict.
+    """
+    state = {"entries": [], "fetch_fails": set(), "merge_fails": set(), "fetched": []}
+    lock  = threading.Lock()
+
+    def fetch(url):
+        video_id = url.rsplit("/", 1)[1]
+        with lock:
+            state["fetched"].append(video_id)
+        # later entries finish first
+        time.sleep(0.01 * (len(state["entries"]) - [e and e["id"] for e in state["entries"]].index(video_id)))
+        if video_id in state["fetch_fails"]:
+            raise DownloadFailed(url, "boom")
+        return {"url": url, "id": video_id}
+
+    def merge(streams, ffmpeg, threads):
+        if streams["id"] in state["merge_fails"]:
+            raise MergeError("bad merge")
+        return DownloadResult(path=f"/out/{streams['id']}.mp4", title=streams["id"], url=streams["url"])
+
+    monkeypatch.setattr(core, "_ENV_CACHE", {"ffmpeg": "/usr/bin/ffmpeg", "js_runtimes": {}})
+    monkeypatch.setattr(core, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(core, "_init_playlist_worker", lambda *args: None)
+    monkeypatch.setattr(core, "_iter_playlist_entries", lambda url, debug=False: iter(state["entries"]))
+    monkeypatch.setattr(core, "_fetch_streams", fetch)
+    monkeypatch.setattr(core, "_merge_streams", merge)
+    return state
+
+
+def test_playlist_keeps_order_and_records_failures(fake_playlist, tmp_path):
+    fake_playlist["entries"]     = [_entry("a"), _entry("b"), None, _entry("c"), _entry("d"), _entry("e")]
+    fake_playlist["fetch_fails"] = {"b"}
+    fake_playlist["merge_fails"] = {"d"}
+
+    result = core.download_playlist_mp4("https://y/playlist?list=PL", output_dir=str(tmp_path),
+                                        workers=3, chunk_size=2)
+
+    assert result.total == 6
+    assert [d.title for d in result.downloads] == ["a", "c", "e"]
+    assert result.failed == ["https://youtu.be/b", "unknown", "https://youtu.be/d"]
+    assert str(result) == "PlaylistResult(3/6 downloaded, 3 failed)"
+
+
+def test_playlist_downloads_repeated_video_once(fake_playlist, tmp_path):
+    fake_playlist["entries"]     = [_entry("a"), _entry("b"), _entry("a"), _entry("b")]
+    fake_playlist["fetch_fails"] = {"b"}
+
+    result = core.download_playlist_mp4("https://y/playlist?list=PL", output_dir=str(tmp_path),
+                                        workers=2, chunk_size=1)
+
+    assert sorted(fake_playlist["fetched"]) == ["a", "b"]
+    assert [d.title for d in result.downloads] == ["a", "a"]
+    assert result.failed == ["https://youtu.be/b", "https://youtu.be/b"]
+
+
+def test_playlist_skips_finished_videos(fake_playlist, tmp_path):
+    (tmp_path / "Old title [a].mp4").write_bytes(b"x" * 10)
+    (tmp_path / "Partial [b].temp.mp4").write_bytes(b"")
+    fake_playlist["entries"] = [_entry("a", "Title A"), _entry("b")]
+
+    result = core.download_playlist_mp4("https://y/playlist?list=PL", output_dir=str(tmp_path))
+
+    assert fake_playlist["fetched"] == ["b"]
+    skipped = result.downloads[0]
+    assert skipped.path == tmp_path / "Old title [a].mp4"
+    assert (skipped.title, skipped.filesize) == ("Title A", 10)
+    assert result.downloads[1].title == "b"
+
+
+def test_playlist_recreates_deleted_output_dir(fake_playlist, tmp_path, monkeypatch):
+    out = tmp_path / "out"
+    monkeypatch.setattr(core, "_CREATED_DIRS", {str(out)})   # created earlier, since deleted
+    fake_playlist["entries"] = [_entry("a")]
+
+    result = core.download_playlist_mp4("https://y/playlist?list=PL", output_dir=str(out))
+
+    assert out.is_dir()
+    assert [d.title for d in result.downloads] == ["a"]
+
+
+def test_playlist_window_refills_while_a_download_is_slow(fake_playlist, tmp_path, monkeypatch):
+    # 'a' only finishes once 'd' has started: with a batch barrier at
+    # chunk_size=2, 'd' would wait for 'a' instead.
+    released = threading.Event()
+    overlap  = []
+
+    def fetch(url):
+        video_id = url.rsplit("/", 1)[1]
+        if video_id == "d":
+            released.set()
+        if video_id == "a":
+            overlap.append(released.wait(timeout=2))
+        return {"url": url, "id": video_id}
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(core, "_fetch_streams", fetch)
+    fake_playlist["entries"] = [_entry(v) for v in "abcd"]
+
+    result = core.download_playlist_mp4("https://y/playlist?list=PL", output_dir=str(tmp_path),
+                                        workers=2, chunk_size=2)
+
+    assert overlap == [True]
+    assert [d.title for d in result.downloads] == ["a", "b", "c", "d"]
+
+
+def test_playlist_waits_for_merges_when_ffmpeg_falls_behind(fake_playlist, tmp_path, monkeypatch):
+    unmerged = {"now": 0, "max": 0}
+    lock     = threading.Lock()
+
+    def fetch(url):
+        with lock:
+            unmerged["now"] += 1
+            unmerged["max"]  = max(unmerged["max"], unmerged["now"])
+        return {"url": url, "id": url.rsplit("/", 1)[1]}
+
+    def merge(streams, ffmpeg, threads):
+        time.sleep(0.02)
+        with lock:
+            unmerged["now"] -= 1
+        return DownloadResult(path=f"/out/{streams['id']}.mp4", title=streams["id"], url=streams["url"])
+
+    monkeypatch.setattr(core, "_fetch_streams", fetch)
+    monkeypatch.setattr(core, "_merge_streams", merge)
+    fake_playlist["entries"] = [_entry(str(i)) for i in range(10)]
+
+    result = core.download_playlist_mp4("https://y/playlist?list=PL", output_dir=str(tmp_path),
+                                        workers=1, chunk_size=1)
+
+    assert len(result.downloads) == 10
+    # one download in the window + up to workers queued merges + one merging
+    assert unmerged["max"] <= 3
+
+
+def test_playlist_interrupt_cancels_queued_downloads(fake_playlist, tmp_path, monkeypatch):
+    release = threading.Event()
+    fetched = []
+
+    def fetch(url):
+        fetched.append(url.rsplit("/", 1)[1])
+        release.wait(timeout=5)
+        return {"url": url, "id": fetched[-1]}
+
+    def entries(url, debug=False):
+        yield _entry("a")
+        yield _entry("b")
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(core, "_fetch_streams", fetch)
+    monkeypatch.setattr(core, "_iter_playlist_entries", entries)
+
+    start = time.monotonic()
+    with pytest.raises(KeyboardInterrupt):
+        core.download_playlist_mp4("https://y/playlist?list=PL", output_dir=str(tmp_path),
+                                   workers=1, chunk_size=3)
+    release.set()
+
+    assert time.monotonic() - start < 4   # did not wait for the running download
+    assert "b" not in fetched             # the queued one was cancelled
+
+
+def test_playlist_outtmpl_names_streams_by_id():
+    opts = core._fetch_opts("out", "best")
+    assert opts["outtmpl"] == os.path.join("out", "%(title)s [%(id)s].f%(format_id)s.%(ext)s")
+
+
+def test_playlist_format_prefers_capped_combined_stream():
+    opts = core._fetch_opts("out", "720")
+    assert opts["format"] == ("bestvideo[height<=720]/best[height<=720]/bestvideo/best,"
+                              "bestaudio[ext=m4a]/bestaudio")
+
+
+@pytest.fixture
+def fake_ffmpeg(monkeypatch):
+    """Replace subprocess.run with a fake ffmpeg that writes its output file."""
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        with open(cmd[-1], "wb") as f:
+            f.write(b"merged")
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    return calls
+
+
+def _streams(tmp_path, audio=True):
+    video = tmp_path / "T [a].f137.mp4"
+    video.write_bytes(b"v")
+    streams = {"url": "https://youtu.be/a", "title": "T", "width": 1920, "height": 1080,
+               "video_codec": "avc1", "audio_codec": "mp4a.40.2", "video": str(video), "audio": None}
+    if audio:
+        (tmp_path / "T [a].f140.m4a").write_bytes(b"a")
+        streams["audio"] = str(tmp_path / "T [a].f140.m4a")
+    return streams
+
+
+def test_merge_streams_maps_separate_audio(fake_ffmpeg, tmp_path):
+    result = core._merge_streams(_streams(tmp_path), "ffmpeg", threads=2)
+
+    cmd = fake_ffmpeg[0]
+    assert cmd.count("-i") == 2
+    maps = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-map"]
+    assert maps == ["0:v:0", "1:a:0"]
+    assert cmd[cmd.index("-c:a") + 1] == "copy"   # AAC source is not re-encoded
+    assert cmd[-1].endswith("T [a].temp.mp4")
+    assert result.path == (tmp_path / "T [a].mp4").resolve()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["T [a].mp4"]
+
+
+def test_merge_streams_keeps_combined_stream_audio(fake_ffmpeg, tmp_path):
+    core._merge_streams(_streams(tmp_path, audio=False), "ffmpeg", threads=2)
+
+    cmd = fake_ffmpeg[0]
+    assert cmd.count("-i") == 1
+    maps = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "-map"]
+    assert maps == ["0:v:0", "0:a:0?"]
+
+
+def test_merge_streams_failure_removes_temp_file(monkeypatch, tmp_path):
+    def run(cmd, **kwargs):
+        open(cmd[-1], "wb").close()
+        return subprocess.CompletedProcess(cmd, 1, "", "Invalid data found")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    streams = _streams(tmp_path)
+    with pytest.raises(MergeError, match="Invalid data found"):
+        core._merge_streams(streams, "ffmpeg", threads=2)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["T [a].f137.mp4", "T [a].f140.m4a"]
+
+
+def test_iter_playlist_entries_single_video(fake_ydl):
+    url = "https://y/watch?v=a"
+    FakeYDL.RESULTS[url] = _video("a")
+
+    entries = list(core._iter_playlist_entries(url, debug=True))
+
+    assert entries == [{"url": "https://y/watch?v=a", "id": "a", "title": "Video a"}]
+
+
+# ---------------------------------------------------------------------------
+# download_mp4 / download_mp3 with reused and playlist infos
+# ---------------------------------------------------------------------------
+
+def _video(video_id, heights=(1080,)):
+    formats = [{"format_id": f"v{h}", "url": f"https://x/{video_id}/{h}", "ext": "mp4",
+                "protocol": "https", "vcodec": "avc1", "acodec": "none",
+                "height": h, "width": h * 16 // 9} for h in heights]
+    formats.append({"format_id": "140", "url": f"https://x/{video_id}/a", "ext": "m4a",
+                    "protocol": "https", "vcodec": "none", "acodec": "mp4a.40.2", "abr": 128})
+    return {"id": video_id, "title": f"Video {video_id}", "formats": formats,
+            "extractor": "fake", "extractor_key": "Fake",
+            "webpage_url": f"https://y/watch?v={video_id}"}
+
+
+class FakeYDL(yt_dlp.YoutubeDL):
+    """
+    A real YoutubeDL (format selection, playlist processing, sanitizing)
+    whose extractor returns RESULTS[url] and whose per-video download
+    only records the video id.
+    """
+    RESULTS: dict = {}
+    downloaded: list = []
+
+    def extract_info(self, url, download=True, ie_key=None, extra_info=None,
+                     process=True, force_generic_extractor=False):
+        result = copy.deepcopy(self.RESULTS[url])
+        return self.process_ie_result(result, download, extra_info or {}) if process else result
+
+    def process_info(self, info_dict):
+        FakeYDL.downloaded.append(info_dict["id"])
+        info_dict["filepath"] = f"/out/{info_dict['id']}.mp4"
+
+
+@pytest.fixture
+def fake_ydl(monkeypatch):
+    FakeYDL.RESULTS    = {}
+    FakeYDL.downloaded = []
+    stored = []
+    monkeypatch.setattr(yt_dlp, "YoutubeDL", FakeYDL)
+    monkeypatch.setattr(core, "_ENV_CACHE", {"ffmpeg": "/usr/bin/ffmpeg", "js_runtimes": {}})
+    monkeypatch.setattr(core, "get_cached_info", lambda url: None)
+    monkeypatch.setattr(core, "_cache_enabled", lambda: True)
+    monkeypatch.setattr(core, "store_info", lambda url, info: stored.append(info["id"]))
+    return stored
+
+
+def test_download_mp4_playlist_url(fake_ydl, tmp_path):
+    url = "https://y/playlist?list=PL"
+    FakeYDL.RESULTS[url] = {"_type": "playlist", "id": "PL", "title": "pl",
+                            "extractor": "fake", "extractor_key": "Fake", "webpage_url": url,
+                            "entries": [_video("a"), _video("b")]}
+
+    core.download_mp4(url, output_dir=str(tmp_path), debug=True)
+
+    assert FakeYDL.downloaded == ["a", "b"]
+    assert fake_ydl == []   # playlist infos are not cached
+
+
+def test_download_mp4_preselects_and_caches_video(fake_ydl, tmp_path):
+    url = "https://y/watch?v=a"
+    FakeYDL.RESULTS[url] = _video("a")
+
+    result = core.download_mp4(url, output_dir=str(tmp_path), debug=True)
+
+    assert FakeYDL.downloaded == ["a"]
+    assert fake_ydl == ["a"]
+    assert result.resolution == "1080p"
+
+
+def test_download_mp4_info_without_matching_format(fake_ydl, tmp_path):
+    with pytest.raises(DownloadFailed, match="Requested format is not available"):
+        core.download_mp4("https://y/watch?v=a", output_dir=str(tmp_path), debug=True,
+                          info=_video("a", heights=(1080,)), resolution="720")
+
+
+def test_download_mp3_info_without_formats(fake_ydl, tmp_path):
+    info = dict(_video("a"), formats=[])
+    with pytest.raises(DownloadFailed):
+        core.download_mp3("https://y/watch?v=a", output_dir=str(tmp_path), debug=True, info=info)
+
+
+# ---------------------------------------------------------------------------
+# YtmediaSession
+# ---------------------------------------------------------------------------
+
+def test_session_reuses_one_ydl_per_option_set(fake_ydl, tmp_path, monkeypatch):
+    built, closed = [], []
+
+    class CountingYDL(FakeYDL):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            built.append(self)
+
+        def close(self):
+            closed.append(self)
+            super().close()
+
+    monkeypatch.setattr(yt_dlp, "YoutubeDL", CountingYDL)
+    for video_id in "ab":
+        FakeYDL.RESULTS[f"https://y/watch?v={video_id}"] = _video(video_id, heights=(720, 1080))
+
+    with core.YtmediaSession() as session:
+        for video_id in "ab":
+            core.download_mp4(f"https://y/watch?v={video_id}", output_dir=str(tmp_path),
+                              debug=True, session=session)
+        result = core.download_mp4("https://y/watch?v=a", output_dir=str(tmp_path),
+                                   debug=True, resolution="720", session=session)
+        assert len(built) == 2   # one per resolution
+        assert closed == []      # left open between downloads
+
+    assert closed == built
+    assert FakeYDL.downloaded == ["a", "b", "a"]
+    assert result.resolution == "720p"
+
+
+# ---------------------------------------------------------------------------
+# get_size
+# ---------------------------------------------------------------------------
+
+def _sized_video(video_id, video_size, audio_size):
+    info = _video(video_id)
+    info["formats"][0]["filesize"] = video_size
+    info["formats"][1]["filesize"] = audio_size
+    return info
+
+
+def test_get_size_adds_reported_and_probed_sizes(fake_ydl, monkeypatch):
+    FakeYDL.RESULTS["https://y/watch?v=a"] = _sized_video("a", 1000, None)
+    probed = []
+    monkeypatch.setattr(core, "_probe_size", lambda ydl, fmt: probed.append(fmt["format_id"]) or 24)
+
+    assert core.get_size("https://y/watch?v=a") == 1024
+    assert probed == ["140"]
+
+
+def test_get_size_unknown(fake_ydl, monkeypatch):
+    FakeYDL.RESULTS["https://y/watch?v=a"] = _sized_video("a", 1000, None)
+    monkeypatch.setattr(core, "_probe_size", lambda ydl, fmt: None)
+
+    assert core.get_size("https://y/watch?v=a") is None
+
+
+class _Response:
+    def __init__(self, status, headers):
+        self.status, self.headers = status, headers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+@pytest.mark.parametrize("status, headers, size", [
+    (206, {"Content-Range": "bytes 0-0/4096"},  4096),
+    (200, {"Content-Length": "2048"},           2048),
+    (206, {"Content-Range": "bytes 0-0/*"},     None),
+])
+def test_probe_size_reads_range_response(status, headers, size):
+    requests = []
+
+    class YDL:
+        def urlopen(self, request):
+            requests.append(request)
+            return _Response(status, headers)
+
+    fmt = {"url": "https://x/a", "protocol": "https", "http_headers": {"User-Agent": "ua"}}
+    assert core._probe_size(YDL(), fmt) == size
+    assert requests[0].headers["Range"] == "bytes=0-0"
+    assert requests[0].headers["User-Agent"] == "ua"
+
+
+def test_probe_size_skips_fragmented_formats():
+    assert core._probe_size(None, {"url": "https://x/a.m3u8", "protocol": "m3u8_native"}) is None
+
+
+# ---------------------------------------------------------------------------
+# get_info_many_async
+# ---------------------------------------------------------------------------
+
+def test_get_info_many_async_keeps_order_and_limit(monkeypatch):
+    running = {"now": 0, "max": 0}
+    lock    = threading.Lock()
+
+    def get_info(url):
+        with lock:
+            running["now"] += 1
+            running["max"]  = max(running["max"], running["now"])
+        time.sleep(0.01 * (5 - int(url)))   # later URLs finish first
+        with lock:
+            running["now"] -= 1
+        return {"id": url}
+
+    monkeypatch.setattr(core, "get_info", get_info)
+
+    infos = asyncio.run(core.get_info_many_async([str(i) for i in range(5)], concurrency=2))
+
+    assert [info["id"] for info in infos] == ["0", "1", "2", "3", "4"]
+    assert running["max"] == 2
+
+
+def test_get_info_many_async_raises_first_failure(monkeypatch):
+    def get_info(url):
+        if url == "bad":
+            raise DownloadFailed(url, "gone")
+        return {"id": url}
+
+    monkeypatch.setattr(core, "get_info", get_info)
+
+    with pytest.raises(DownloadFailed, match="gone"):
+        asyncio.run(core.get_info_many_async(["a", "bad", "c"]))
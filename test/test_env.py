@@ -0,0 +1,174 @@
+"""
+test_env.py
+===========
+Offline tests for the PATH index behind find_ffmpeg / find_node / find_deno
+and the env.json file that carries their results across processes.
+"""
+
+import json
+import os
+import sys
+import types
+
+import pytest
+
+from ytmedia import env
+
+
+def _touch(path, executable=True):
+    path.write_text("")
+    path.chmod(0o755 if executable else 0o644)
+    return str(path)
+
+
+@pytest.fixture
+def path_dirs(tmp_path, monkeypatch):
+    """Two empty directories set as PATH, with the index cache cleared."""
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    monkeypatch.setenv("PATH", os.pathsep.join([str(first), str(tmp_path / "missing"), str(second)]))
+    env._path_index.cache_clear()
+    yield first, second
+    env._path_index.cache_clear()
+
+
+def test_path_index_keeps_path_order(path_dirs):
+    first, second = path_dirs
+    a = _touch(first / "ffmpeg")
+    b = _touch(second / "ffmpeg")
+
+    assert env._path_index()["ffmpeg"] == (a, b)
+    assert env._which("ffmpeg") == a
+
+
+def test_which_skips_non_executable_files(path_dirs):
+    first, second = path_dirs
+    _touch(first / "node", executable=False)
+    found = _touch(second / "node")
+
+    assert env._which("node") == found
+
+
+def test_which_missing_binary(path_dirs):
+    assert env._which("deno") is None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="simulates Windows on POSIX")
+def test_path_index_windows_pathext(path_dirs, monkeypatch):
+    first, _ = path_dirs
+    found = _touch(first / "Node.EXE")
+    _touch(first / "notes.txt")
+    monkeypatch.setattr(sys, "platform", "win32")
+    monkeypatch.setenv("PATHEXT", os.pathsep.join([".COM", ".EXE", ".BAT"]))
+
+    index = env._path_index()
+    assert index["node.exe"] == (found,)
+    assert index["node"] == (found,)
+    assert "notes" not in index
+    assert env._which("NODE") == found
+
+
+# ---------------------------------------------------------------------------
+# env.json
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def env_file(path_dirs, tmp_path, monkeypatch):
+    """env.json inside tmp_path, with every detection cache cleared."""
+    monkeypatch.setattr(env, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(env, "_ENV_FILE", str(tmp_path / "env.json"))
+    monkeypatch.delenv("YTMEDIA_USE_STATIC_FFMPEG", raising=False)
+    env.clear_env_cache()
+    yield tmp_path / "env.json"
+    env.clear_env_cache()
+
+
+def _new_process(monkeypatch, path):
+    """Clear the in-memory caches but keep env.json, as a fresh process would."""
+    monkeypatch.setenv("PATH", path)
+    for cached in (env._persisted, env._path_index, env.find_ffmpeg, env.find_node, env.find_deno):
+        cached.cache_clear()
+
+
+def _save(env_file, **paths):
+    env_file.write_text(json.dumps({"PATH": os.environ["PATH"], **paths}))
+
+
+def test_found_path_is_saved(path_dirs, env_file):
+    first, _ = path_dirs
+    node = _touch(first / "node")
+
+    assert env.find_node() == node
+    assert json.loads(env_file.read_text()) == {"PATH": os.environ["PATH"], "node": node}
+
+
+def test_saved_path_is_reused(path_dirs, env_file, tmp_path):
+    saved = _touch(tmp_path / "node")
+    _save(env_file, node=saved)
+
+    assert env.find_node() == saved
+
+
+def test_saved_paths_ignored_after_path_change(path_dirs, env_file, tmp_path, monkeypatch):
+    first, _ = path_dirs
+    _save(env_file, node=_touch(tmp_path / "node"))
+    monkeypatch.setenv("PATH", str(first))
+    found = _touch(first / "node")
+
+    assert env.find_node() == found
+
+
+@pytest.mark.parametrize("stale", ["deleted", "not executable", "directory"])
+def test_stale_saved_path_is_probed_again(path_dirs, env_file, tmp_path, stale):
+    first, _ = path_dirs
+    saved = tmp_path / "deno"
+    if stale == "not executable":
+        _touch(saved, executable=False)
+    elif stale == "directory":
+        saved.mkdir()
+    _save(env_file, deno=str(saved))
+    found = _touch(first / "deno")
+
+    assert env.find_deno() == found
+    assert json.loads(env_file.read_text())["deno"] == found
+
+
+@pytest.fixture
+def fake_static_ffmpeg(tmp_path, monkeypatch):
+    """An installed static_ffmpeg whose add_paths() puts an ffmpeg on PATH."""
+    bundled = tmp_path / "bundled"
+    bundled.mkdir()
+    binary = _touch(bundled / "ffmpeg")
+
+    def add_paths():
+        os.environ["PATH"] = os.pathsep.join([str(bundled), os.environ["PATH"]])
+
+    monkeypatch.setitem(sys.modules, "static_ffmpeg", types.SimpleNamespace(add_paths=add_paths))
+    monkeypatch.setattr(env.importlib.util, "find_spec",
+                        lambda name: object() if name == "static_ffmpeg" else None)
+    return binary
+
+
+def test_static_ffmpeg_path_is_not_saved(env_file, fake_static_ffmpeg):
+    assert env.find_ffmpeg() == fake_static_ffmpeg
+    assert not env_file.exists() or "ffmpeg" not in json.loads(env_file.read_text())
+
+
+def test_static_ffmpeg_env_gate(env_file, fake_static_ffmpeg, monkeypatch):
+    path = os.environ["PATH"]
+    assert env.find_ffmpeg() == fake_static_ffmpeg
+
+    _new_process(monkeypatch, path)
+    monkeypatch.setenv("YTMEDIA_USE_STATIC_FFMPEG", "0")
+    assert env.find_ffmpeg() is None
+
+
+def test_system_ffmpeg_installed_later_wins(path_dirs, env_file, fake_static_ffmpeg, monkeypatch):
+    first, _ = path_dirs
+    path = os.environ["PATH"]
+    assert env.find_ffmpeg() == fake_static_ffmpeg
+
+    system = _touch(first / "ffmpeg")
+    _new_process(monkeypatch, path)
+    assert env.find_ffmpeg() == system